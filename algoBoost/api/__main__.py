@@ -0,0 +1,24 @@
+"""Production entrypoint: ``python -m algoBoost.api`` serves the app on uvloop + httptools."""
+
+from __future__ import annotations
+
+import os
+
+import uvicorn
+
+
+def main() -> None:
+    # Workers inherit the environment, so each one checks it really got uvloop
+    os.environ.setdefault("API_REQUIRE_UVLOOP", "1")
+    uvicorn.run(
+        "algoBoost.api.main:app",
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("API_WORKERS", os.cpu_count() or 1)),
+    )
+
+
+if __name__ == "__main__":
+    main()
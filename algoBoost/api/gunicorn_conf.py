@@ -0,0 +1,18 @@
+"""Gunicorn settings for production.
+
+Canonical launch:
+    gunicorn -c algoBoost/api/gunicorn_conf.py algoBoost.api.main:app
+
+Each UvicornWorker picks up uvloop + httptools when installed; the startup
+uvloop check in ``main.create_app`` is switched on here so it runs per worker.
+"""
+
+import os
+
+os.environ.setdefault("API_REQUIRE_UVLOOP", "1")
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+workers = int(os.getenv("API_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+keepalive = 5
@@ -2,27 +2,136 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+from functools import lru_cache
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
+from .job_ids import refill_pool
 from .routes import health, tasks
 
 
-def _cors_origins() -> list[str]:
+@lru_cache(maxsize=1)
+def _cors_origins() -> frozenset[str]:
+    # Parsed once per process; call ``_cors_origins.cache_clear()`` after changing
+    # API_CORS_ORIGINS (e.g. in tests) to pick up the new value.
     raw = os.getenv("API_CORS_ORIGINS", "http://localhost:3000")
-    return [origin.strip() for origin in raw.split(",") if origin.strip()]
+    return frozenset(origin.strip() for origin in raw.split(",") if origin.strip())
+
+
+class PureASGICORSMiddleware:
+    """Minimal CORS middleware that only touches the ``http.response.start`` message.
+
+    Mirrors the previous ``CORSMiddleware`` setup (credentials allowed, any
+    method/header) without allocating Request/Response wrappers per call.
+    """
+
+    def __init__(self, app, origins: frozenset[str]) -> None:
+        self.app = app
+        self.allowed = frozenset(origins)
+        self.allow_all = "*" in self.allowed
+        # Keyed by the raw header bytes so the hot path never encodes/decodes.
+        self.allow_origin_bytes: dict[bytes, tuple[bytes, bytes]] = {
+            o.encode("latin-1"): (b"access-control-allow-origin", o.encode("latin-1"))
+            for o in self.allowed
+        }
+        self.base_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self.preflight_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+            (b"access-control-max-age", b"600"),
+        ]
+        self.disallowed_headers: list[tuple[bytes, bytes]] = [
+            *self.base_headers,
+            *self.preflight_headers,
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    @staticmethod
+    async def _send_preflight(send, status: int, headers: list[tuple[bytes, bytes]], body: bytes) -> None:
+        headers = [*headers, (b"content-length", str(len(body)).encode("latin-1"))]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allow_origin = self.allow_origin_bytes.get(origin)
+        if allow_origin is None and self.allow_all:
+            allow_origin = (b"access-control-allow-origin", origin)
+
+        # Like Starlette, only OPTIONS carrying Access-Control-Request-Method is a
+        # preflight; plain OPTIONS requests reach the app's own routes
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if allow_origin is None:
+                await self._send_preflight(send, 400, self.disallowed_headers, b"Disallowed CORS origin")
+                return
+            headers = [allow_origin, *self.base_headers, *self.preflight_headers]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await self._send_preflight(send, 200, headers, b"")
+            return
+
+        if allow_origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [allow_origin, *self.base_headers]
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _require_uvloop() -> None:
+    """Fail fast on the stock asyncio loop when API_REQUIRE_UVLOOP=1.
+
+    Opt-in: the production entrypoints (``python -m algoBoost.api`` and
+    gunicorn_conf) turn it on; ``uvicorn --loop asyncio`` and TestClient don't.
+    """
+    if os.getenv("API_REQUIRE_UVLOOP", "0") != "1":
+        return
+    try:
+        import uvloop
+    except ImportError as exc:
+        raise RuntimeError("API_REQUIRE_UVLOOP=1 but uvloop is not installed") from exc
+    if not isinstance(asyncio.get_running_loop(), uvloop.Loop):
+        raise RuntimeError(
+            "AlgoBoost API must run on uvloop; start it with `python -m algoBoost.api`"
+        )
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="AlgoBoost Workflow API", version="0.1.0")
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=_cors_origins(),
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+    app = FastAPI(
+        title="AlgoBoost Workflow API",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
+    app.add_event_handler("startup", _require_uvloop)
+    app.add_event_handler("startup", refill_pool)
+    app.add_middleware(PureASGICORSMiddleware, origins=_cors_origins())
     app.include_router(health.router, prefix="/health", tags=["health"])
     app.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
     return app
@@ -31,9 +140,13 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-@app.get("/", tags=["health"])
-def root() -> dict[str, str]:
-    return {"status": "ok"}
+_ROOT = {"status": "ok"}
+_ROOT_BYTES = json.dumps(_ROOT).encode()
+
+
+@app.get("/", tags=["health"], response_class=Response)
+async def root() -> Response:
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 
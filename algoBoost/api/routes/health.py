@@ -1,22 +1,34 @@
+import json
+
 from fastapi import APIRouter
+from fastapi.responses import Response
 
 router = APIRouter()
 
+# Constant payloads, serialized once at import so probes skip per-request encoding.
+_PING = {"status": "alive"}
+_LIVE = {"status": "ok"}
+_READY = {"status": "ready"}
+
+_PING_BYTES = json.dumps(_PING).encode()
+_LIVE_BYTES = json.dumps(_LIVE).encode()
+_READY_BYTES = json.dumps(_READY).encode()
+
 
-@router.get("/ping")
-def ping() -> dict[str, str]:
-    return {"status": "alive"}
+@router.get("/ping", response_class=Response)
+async def ping() -> Response:
+    return Response(content=_PING_BYTES, media_type="application/json")
 
 
-@router.get("/live")
-def live() -> dict[str, str]:
-    return {"status": "ok"}
+@router.get("/live", response_class=Response)
+async def live() -> Response:
+    return Response(content=_LIVE_BYTES, media_type="application/json")
 
 
-@router.get("/ready")
-def ready() -> dict[str, str]:
+@router.get("/ready", response_class=Response)
+async def ready() -> Response:
     # Extend with dependency checks (RPC, storage, etc.) when implemented.
-    return {"status": "ready"}
+    return Response(content=_READY_BYTES, media_type="application/json")
 
 
 
@@ -1,16 +1,20 @@
 """Task offload endpoints for AlgoBoost workflows."""
 
 from typing import Optional
-from uuid import uuid4
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ..deps import get_agent
+from ..job_ids import next_job_id
 
 
 router = APIRouter()
 
+_STATUS_URL_TMPL = "https://example.aioz.storage/tasks/".__add__
+_STATUS_STUB_MESSAGE = "Status stub; connect to W3AI job polling once available."
+
 
 class OffloadRequest(BaseModel):
     dataset_path: str = Field(...,
@@ -48,8 +52,10 @@ def _should_offload(size_gb: Optional[float]) -> bool:
     return size_gb > 0.1
 
 
-@router.post("/offload", response_model=OffloadResponse)
-def offload_task(payload: OffloadRequest, agent=Depends(get_agent)):
+# response_model=None: the handler already builds a validated OffloadResponse, so
+# FastAPI should serialize it as-is instead of validating it a second time.
+@router.post("/offload", response_model=None, responses={200: {"model": OffloadResponse}})
+async def offload_task(payload: OffloadRequest, agent=Depends(get_agent)) -> OffloadResponse:
     """Decide to offload and return a stubbed job record for the UI."""
     _ = agent  # placeholder: future use for prompt-driven decisions
 
@@ -60,10 +66,10 @@ def offload_task(payload: OffloadRequest, agent=Depends(get_agent)):
             message="Dataset small enough to run locally.",
         )
 
-    job_id = f"job-{uuid4().hex[:8]}"
+    job_id = next_job_id()
 
     # Placeholder URLs/hashes; replace with AiozComputeTool + NeoPaymentTool outputs.
-    storage_url = f"https://example.aioz.storage/tasks/{job_id}"
+    storage_url = _STATUS_URL_TMPL(job_id)
     tx_hash = "simulated-gas-tx-hash"
 
     if payload.dry_run:
@@ -85,16 +91,17 @@ def offload_task(payload: OffloadRequest, agent=Depends(get_agent)):
     )
 
 
-@router.get("/{job_id}", response_model=TaskStatusResponse)
-def get_task_status(job_id: str):
+@router.get("/{job_id}", responses={200: {"model": TaskStatusResponse}})
+async def get_task_status(job_id: str):
     """Stubbed status endpoint for polling from the UI."""
-    return TaskStatusResponse(
-        job_id=job_id,
-        status="queued",
-        storage_url=f"https://example.aioz.storage/tasks/{job_id}",
-        result_url=None,
-        message="Status stub; connect to W3AI job polling once available.",
-    )
+    # Shape is fixed and trusted, so skip Pydantic and serialize directly.
+    return ORJSONResponse({
+        "job_id": job_id,
+        "status": "queued",
+        "storage_url": _STATUS_URL_TMPL(job_id),
+        "result_url": None,
+        "message": _STATUS_STUB_MESSAGE,
+    })
 
 
 
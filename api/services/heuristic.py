@@ -0,0 +1,92 @@
+"""Learned runtime estimates for offload decisions.
+
+Completed runs are appended to a JSONL file; ``predict`` fits a small decision
+tree per task type from those samples. The tree learns minutes per byte rather
+than minutes, so sizes beyond the recorded range scale with the nearest rate
+instead of flattening to the largest runtime seen. scikit-learn is optional —
+without it (or with too few samples) ``predict`` returns None and callers keep
+their static heuristic.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+try:
+    from sklearn.tree import DecisionTreeRegressor
+except ImportError:  # pragma: no cover - optional dependency
+    DecisionTreeRegressor = None
+
+
+# Defaults next to this module so the samples don't depend on the working directory.
+_SAMPLES_PATH = Path(
+    os.getenv("ALGOBOOST_HEURISTIC_PATH", Path(__file__).resolve().parent / "algoboost_runtimes.jsonl")
+)
+_MIN_SAMPLES = 10
+
+
+def _sampling_only() -> bool:
+    """ALGOBOOST_HEURISTIC_SAMPLING=1 records timings but never predicts (training runs)."""
+    return os.getenv("ALGOBOOST_HEURISTIC_SAMPLING", "0") == "1"
+
+
+def record(task_type: str, size_bytes: int, runtime_s: float) -> None:
+    """Append one observed runtime to the samples file."""
+    line = json.dumps({"task_type": task_type, "size_bytes": size_bytes, "runtime_s": runtime_s})
+    try:
+        with _SAMPLES_PATH.open("a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=32)
+def _load_model(task_type: str, path: str, mtime_ns: int):
+    # mtime_ns is part of the cache key so new samples trigger a refit.
+    sizes: list[list[int]] = []
+    rates: list[float] = []  # minutes per byte
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            # Skip malformed rows (bad JSON, non-objects, missing or null fields)
+            # rather than letting one of them break every prediction.
+            try:
+                row = json.loads(line)
+                if row.get("task_type") != task_type:
+                    continue
+                size = int(row["size_bytes"])
+                rate = float(row["runtime_s"]) / 60.0 / size
+            except (ValueError, KeyError, TypeError, AttributeError, ArithmeticError):
+                continue
+            if size > 0 and rate >= 0 and math.isfinite(rate):
+                sizes.append([size])
+                rates.append(rate)
+    if len(sizes) < _MIN_SAMPLES:
+        return None
+    model = DecisionTreeRegressor(max_depth=4)
+    try:
+        model.fit(sizes, rates)
+    except ValueError:
+        return None
+    return model
+
+
+def predict(task_type: str, size_bytes: int) -> Optional[float]:
+    """Estimated runtime in minutes, or None when unsure."""
+    if DecisionTreeRegressor is None or _sampling_only():
+        return None
+    try:
+        mtime_ns = _SAMPLES_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+    try:
+        model = _load_model(task_type, str(_SAMPLES_PATH), mtime_ns)
+    except OSError:  # file replaced or removed since the stat
+        return None
+    if model is None:
+        return None
+    return float(model.predict([[size_bytes]])[0]) * size_bytes
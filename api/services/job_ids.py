@@ -0,0 +1,47 @@
+"""Pre-minted job identifiers for OffloadService."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+from collections import deque
+
+_POOL_SIZE = 1024
+_LOW_WATERMARK = 128
+_ID_BYTES = 4
+
+_JOB_ID_POOL: deque[str] = deque()
+_refill_task: asyncio.Task | None = None
+
+
+def _refill_pool() -> None:
+    """Top the pool up from a single ``os.urandom`` read instead of one per id."""
+    missing = _POOL_SIZE - len(_JOB_ID_POOL)
+    if missing <= 0:
+        return
+    raw = os.urandom(missing * _ID_BYTES).hex()
+    step = _ID_BYTES * 2
+    _JOB_ID_POOL.extend(raw[i:i + step] for i in range(0, len(raw), step))
+
+
+async def refill_pool() -> None:
+    """Startup hook: fill the pool off the request path."""
+    _refill_pool()
+
+
+def _schedule_refill() -> None:
+    global _refill_task
+    if _refill_task is not None and not _refill_task.done():
+        return
+    try:
+        _refill_task = asyncio.get_running_loop().create_task(refill_pool())
+    except RuntimeError:  # no running loop (sync caller); refill inline
+        _refill_pool()
+
+
+def next_job_id() -> str:
+    if len(_JOB_ID_POOL) < _LOW_WATERMARK:
+        _schedule_refill()
+    token = _JOB_ID_POOL.popleft() if _JOB_ID_POOL else secrets.token_hex(_ID_BYTES)
+    return f"job-{token}"
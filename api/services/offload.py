@@ -1,14 +1,34 @@
 from __future__ import annotations
 
 import os
-import uuid
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Literal, Optional
 
+from . import heuristic
+from .job_ids import next_job_id
 
-_SIZE_THRESHOLD_BYTES = 100 * 1024 * 1024  # 100MB default
+
+# Two-threshold policy: below the lower bound always run locally, at or above the
+# upper bound always offload, and probe locally in between.
+_LOWER_SIZE_BYTES = int(os.getenv("OFFLOAD_LOWER_SIZE_BYTES", 10 * 1024 * 1024))  # 10MB default
+_SIZE_THRESHOLD_BYTES = int(os.getenv("OFFLOAD_UPPER_SIZE_BYTES", 100 * 1024 * 1024))  # 100MB default
 _TIME_THRESHOLD_MINUTES = 10
+_INV_GB = 1.0 / (1024**3)
+_MIN_PER_GB = 8.0  # assume ~8 minutes per GB as a placeholder
+_MIN_RUNTIME_MINUTES = 2.0
+_PROBE_BYTES = 1024 * 1024  # sample the first 1MB when probing
+
+Decision = Literal["local", "probe", "offload"]
+
+
+def _stat_size(path: str) -> Optional[int]:
+    """Size of ``path`` from a single ``stat()`` call, or None if it is unreadable."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
 
 
 @dataclass
@@ -24,19 +44,33 @@ class OffloadResult:
 class OffloadService:
     """Decide whether to offload and (for now) simulate the remote call."""
 
-    def __init__(self, size_threshold_bytes: int = _SIZE_THRESHOLD_BYTES, time_threshold_minutes: int = _TIME_THRESHOLD_MINUTES) -> None:
+    def __init__(
+        self,
+        size_threshold_bytes: int = _SIZE_THRESHOLD_BYTES,
+        time_threshold_minutes: int = _TIME_THRESHOLD_MINUTES,
+        lower_size_bytes: int = _LOWER_SIZE_BYTES,
+        probe: Optional[Callable[[bytes], object]] = None,
+    ) -> None:
         self.size_threshold_bytes = size_threshold_bytes
         self.time_threshold_minutes = time_threshold_minutes
+        self.lower_size_bytes = lower_size_bytes
+        # Local task function used to benchmark a sample in the ambiguous region.
+        self.probe = probe
 
     def offload_task(self, dataset_path: str, task_type: str, dry_run: bool = True) -> OffloadResult:
         size_bytes = self._safe_get_size(dataset_path)
         est_minutes = self._estimate_runtime_minutes(size_bytes, task_type)
-        offload = self._should_offload(size_bytes, est_minutes)
+        decision = self._should_offload(size_bytes, est_minutes)
+        if decision == "probe":
+            probed = self._probe_minutes(dataset_path, size_bytes, task_type)
+            offload = (probed if probed is not None else est_minutes) > self.time_threshold_minutes
+        else:
+            offload = decision == "offload"
 
         # TODO: replace simulation with real tools:
         # - run_remote_compute (AiozComputeTool)
         # - pay_gas_fee (NeoPaymentTool)
-        simulated_job_id = f"job-{uuid.uuid4().hex[:8]}"
+        simulated_job_id = next_job_id()
         simulated_storage_url = f"https://example.s3.aioz.storage/tasks/{Path(dataset_path).name}"
         simulated_payment = "tx-dry-run" if offload else None
         status = "submitted" if offload else "local"
@@ -59,23 +93,44 @@ class OffloadService:
             message=message,
         )
 
-    def _should_offload(self, size_bytes: Optional[int], est_minutes: float) -> bool:
-        if size_bytes is None:
-            return est_minutes > self.time_threshold_minutes
-        return size_bytes > self.size_threshold_bytes or est_minutes > self.time_threshold_minutes
+    def _should_offload(self, size_bytes: Optional[int], est_minutes: float) -> Decision:
+        if est_minutes > self.time_threshold_minutes or (size_bytes or 0) >= self.size_threshold_bytes:
+            return "offload"
+        if size_bytes is None or size_bytes < self.lower_size_bytes:
+            return "local"
+        return "probe"
 
-    def _safe_get_size(self, dataset_path: str) -> Optional[int]:
+    def _probe_minutes(self, dataset_path: str, size_bytes: int, task_type: str) -> Optional[float]:
+        """Time the local task on the first ``_PROBE_BYTES`` and extrapolate to the full size."""
+        if self.probe is None:
+            return None
         try:
-            return os.path.getsize(dataset_path)
-        except (FileNotFoundError, OSError):
+            with open(dataset_path, "rb") as fh:
+                sample = fh.read(_PROBE_BYTES)
+        except OSError:
+            return None
+        if not sample:
             return None
+        started = time.perf_counter()
+        self.probe(sample)
+        elapsed = time.perf_counter() - started
+        # Record against the full size so samples spread over real dataset sizes
+        # rather than all landing on the probe size
+        runtime_s = elapsed * (size_bytes / len(sample))
+        heuristic.record(task_type, size_bytes, runtime_s)
+        return runtime_s / 60.0
+
+    def _safe_get_size(self, dataset_path: str) -> Optional[int]:
+        return _stat_size(dataset_path)
 
     def _estimate_runtime_minutes(self, size_bytes: Optional[int], task_type: str) -> float:
-        # Simple heuristic; adjust per task_type as models become available.
+        # Unknown sizes are pushed over the time threshold so they get offloaded.
         if size_bytes is None:
             return self.time_threshold_minutes + 1
-        gb = size_bytes / (1024**3)
-        base = 2.0 if task_type else 2.0
-        return max(base, gb * 8)  # assume ~8 minutes per GB as a placeholder
+        learned = heuristic.predict(task_type, size_bytes)
+        if learned is not None:
+            return learned
+        # Static fallback until enough runtimes have been recorded.
+        return max(_MIN_RUNTIME_MINUTES, size_bytes * _INV_GB * _MIN_PER_GB)
 
 
@@ -12,6 +12,7 @@ Or set environment variable:
 
 import argparse
 import asyncio
+import hashlib
 import json
 import os
 import sys
@@ -76,9 +77,10 @@ async def deploy_contract(wif: str):
         nef_data = f.read()
     nef = NEF.deserialize_from_bytes(nef_data)
     
-    with open(MANIFEST_PATH, 'r') as f:
-        manifest_dict = json.load(f)
-    manifest = ContractManifest.from_json(manifest_dict)
+    # Keep the raw manifest bytes for the deploy call; parse only for display/hash
+    with open(MANIFEST_PATH, 'rb') as f:
+        manifest_bytes = f.read()
+    manifest = ContractManifest.from_json(json.loads(manifest_bytes))
     
     print(f"Contract: {manifest.name}")
     print(f"Methods: {len(manifest.abi.methods)}")
@@ -96,7 +98,7 @@ async def deploy_contract(wif: str):
     # Build deployment call
     deploy_call = contract_mgmt.call_function(
         "deploy",
-        [nef_data, json.dumps(manifest_dict).encode()]
+        [nef_data, manifest_bytes]
     )
     
     # Add signer
@@ -115,7 +117,6 @@ async def deploy_contract(wif: str):
     await asyncio.sleep(15)
     
     # Calculate contract hash from NEF script (hash160 = ripemd160(sha256(script)))
-    import hashlib
     script_sha256 = hashlib.sha256(nef.script).digest()
     contract_hash = hashlib.new('ripemd160', script_sha256).digest()
     
@@ -20,6 +20,7 @@ Prerequisites:
 
 import argparse
 import asyncio
+import hashlib
 import json
 import os
 import sys
@@ -27,7 +28,9 @@ from pathlib import Path
 
 # Try to import neo3 libraries
 try:
-    from neo3.api.wrappers import ChainFacade, NeoToken, GasToken, GenericContract
+    from neo3.api import noderpc
+    from neo3 import vm
+    from neo3.api.wrappers import ChainFacade, NeoToken, GasToken
     from neo3.api.helpers.signing import sign_insecure_with_account
     from neo3.wallet.account import Account
     from neo3.network.payloads.verification import Signer
@@ -50,6 +53,28 @@ NEF_PATH = SCRIPT_DIR / f"{CONTRACT_NAME}.nef"
 MANIFEST_PATH = SCRIPT_DIR / f"{CONTRACT_NAME}.manifest.json"
 CONFIG_PATH = SCRIPT_DIR.parent / "config.json"
 
+# Probe ripemd160 once: OpenSSL 3 only ships it through the legacy provider
+try:
+    hashlib.new('ripemd160', b'')
+    _RIPEMD160 = lambda d: hashlib.new('ripemd160', d)
+except ValueError:
+    _RIPEMD160 = None
+
+# Native token wrappers are stateless; build them once
+NEO_TOKEN = NeoToken()
+GAS_TOKEN = GasToken()
+
+# One facade per process so every RPC reuses the same client
+_FACADE = None
+
+
+def get_facade() -> ChainFacade:
+    """Get or create the shared testnet ChainFacade."""
+    global _FACADE
+    if _FACADE is None:
+        _FACADE = ChainFacade.node_provider_testnet()
+    return _FACADE
+
 
 def compile_contract():
     """Compile the smart contract using neo3-boa."""
@@ -59,6 +84,17 @@ def compile_contract():
         print(f"ERROR: Source file not found: {source_path}")
         return False
     
+    # Skip boa3 when both artifacts are newer than the source
+    source_mtime = source_path.stat().st_mtime
+    if (
+        NEF_PATH.exists()
+        and MANIFEST_PATH.exists()
+        and NEF_PATH.stat().st_mtime >= source_mtime
+        and MANIFEST_PATH.stat().st_mtime >= source_mtime
+    ):
+        print("Compiled contract is up-to-date, skipping compilation")
+        return True
+    
     try:
         from boa3.boa3 import Boa3
         
@@ -78,11 +114,12 @@ def compile_contract():
 
 async def get_balance(facade: ChainFacade, script_hash: UInt160) -> tuple:
     """Get NEO and GAS balance for an address."""
-    neo = NeoToken()
-    gas = GasToken()
-    
-    neo_result = await facade.test_invoke(neo.balance_of(script_hash))
-    gas_result = await facade.test_invoke(gas.balance_of(script_hash))
+    # Both lookups are independent RPCs; run them concurrently
+    neo_result, gas_result = await asyncio.gather(
+        facade.test_invoke(NEO_TOKEN.balance_of(script_hash)),
+        facade.test_invoke(GAS_TOKEN.balance_of(script_hash)),
+        return_exceptions=False,
+    )
     
     neo_balance = neo_result.result if hasattr(neo_result, 'result') else 0
     gas_balance = gas_result.result if hasattr(gas_result, 'result') else 0
@@ -90,10 +127,49 @@ async def get_balance(facade: ChainFacade, script_hash: UInt160) -> tuple:
     return int(neo_balance), int(gas_balance) / 100000000
 
 
-async def deploy_contract(wif: str, api_url: str = None):
+async def wait_for_confirmation(facade: ChainFacade, tx_hash: str, timeout: int = 30) -> bool:
+    """Poll the application log once per second until the tx is included (or timeout)."""
+    async with noderpc.NeoRpcClient(facade.rpc_host) as client:
+        for _ in range(timeout):
+            await asyncio.sleep(1)
+            try:
+                log = await client.get_application_log_transaction(tx_hash)
+            except Exception:
+                continue  # not in a block yet
+            # No readable VM state counts as failure, never as success
+            state = getattr(getattr(log, "execution", None), "state", None)
+            return state is not None and str(state).endswith("HALT")
+    return False
+
+
+def expected_contract_hash(sender: UInt160, nef_checksum: int, name: str) -> UInt160:
+    """
+    Hash ContractManagement assigns to a deploy: hash160 of the script
+    ABORT, PUSHDATA sender, PUSHINT checksum, PUSHDATA name.
+    """
+    sb = vm.ScriptBuilder()
+    sb.emit(vm.OpCode.ABORT)
+    sb.emit_push(sender.to_array())
+    sb.emit_push(nef_checksum)
+    sb.emit_push(name)
+    script = sb.to_array()
+    return UInt160(_RIPEMD160(hashlib.sha256(script).digest()).digest())
+
+
+async def contract_exists(facade: ChainFacade, contract_hash: UInt160) -> bool:
+    """Check whether a contract with this hash is deployed."""
+    async with noderpc.NeoRpcClient(facade.rpc_host) as client:
+        try:
+            await client.get_contract_state(contract_hash)
+            return True
+        except Exception:
+            return False
+
+
+async def deploy_contract(account: Account, facade: ChainFacade, api_url: str = None):
     """Deploy the malicious contract oracle."""
     
-    # Check if compiled contract exists
+    # Compile if the artifacts are missing or older than the source
     if not NEF_PATH.exists():
         print(f"Compiled contract not found: {NEF_PATH}")
         print("Attempting to compile...")
@@ -101,21 +177,19 @@ async def deploy_contract(wif: str, api_url: str = None):
             print("\nPlease compile the contract manually:")
             print(f"  neo3-boa compile {SCRIPT_DIR / f'{CONTRACT_NAME}.py'}")
             return None
+    elif not compile_contract():
+        print("WARNING: Could not recompile; deploying the existing (possibly stale) NEF")
     
     if not MANIFEST_PATH.exists():
         print(f"Manifest not found: {MANIFEST_PATH}")
         return None
     
-    # Load account from WIF
-    account = Account.from_wif(wif, password='')
     print(f"\n{'='*60}")
     print(f"  Deploying Malicious Contract Oracle")
     print(f"{'='*60}")
     print(f"  Address: {account.address}")
     print(f"  Script Hash: {account.script_hash}")
     
-    # Connect to testnet
-    facade = ChainFacade.node_provider_testnet()
     print(f"  Network: Neo N3 Testnet")
     
     # Check balance
@@ -134,32 +208,40 @@ async def deploy_contract(wif: str, api_url: str = None):
     # Load contract files
     print(f"\n  Loading contract files...")
     
-    with open(NEF_PATH, 'rb') as f:
-        nef_data = f.read()
+    nef_data = NEF_PATH.read_bytes()
     nef = NEF.deserialize_from_bytes(nef_data)
     
-    with open(MANIFEST_PATH, 'r') as f:
-        manifest_dict = json.load(f)
-    manifest = ContractManifest.from_json(manifest_dict)
+    # Keep the raw manifest bytes for the deploy call; parse only for display/hash
+    manifest_bytes = MANIFEST_PATH.read_bytes()
+    manifest = ContractManifest.from_json(json.loads(manifest_bytes))
     
     print(f"  Contract Name: {manifest.name}")
     print(f"  Methods: {len(manifest.abi.methods)}")
     
+    # The contract hash only depends on sender + nef checksum + name, so it is
+    # known before submitting the tx
+    if _RIPEMD160 is None:
+        print("  ERROR: ripemd160 unavailable in this OpenSSL build; enable the legacy provider")
+        return None
+    
+    contract_hash = expected_contract_hash(account.script_hash, nef.checksum, manifest.name)
+    contract_hash_str = f"0x{contract_hash}"
+    print(f"  Expected Contract Hash: {contract_hash_str}")
+    
     # Deploy using ContractManagement
     print(f"\n  Deploying contract...")
     
     # ContractManagement hash on Neo N3
     contract_management_hash = UInt160.from_string("fffdc93764dbaddd97c48f252a53ea4643faa3fd")
     
-    contract_mgmt = GenericContract(contract_management_hash)
-    
-    # Build deployment call with nef bytes and manifest json
-    manifest_bytes = json.dumps(manifest_dict).encode('utf-8')
-    
-    deploy_call = contract_mgmt.call_function(
+    # Emit the ContractManagement.deploy invocation script directly
+    sb = vm.ScriptBuilder()
+    sb.emit_contract_call_with_args(
+        contract_management_hash,
         "deploy",
         [nef_data, manifest_bytes, None]  # nef, manifest, data
     )
+    deploy_script = sb.to_array()
     
     # Add signer using insecure signing (for testnet)
     facade.add_signer(
@@ -169,28 +251,24 @@ async def deploy_contract(wif: str, api_url: str = None):
     
     # Invoke
     try:
-        result = await facade.invoke(deploy_call)
-        tx_hash = str(result) if result else "Unknown"
+        result = await facade.invoke_raw(deploy_script)
+        tx_hash = str(getattr(result, "tx_hash", result)) if result else "Unknown"
         
         print(f"\n  Transaction: {tx_hash}")
         print(f"\n  Waiting for confirmation...")
         
-        # Wait for transaction
-        await asyncio.sleep(20)
-        
-        # Calculate contract hash from sender + nef checksum + name
-        import hashlib
-        
-        # The contract hash is calculated from: sender_scripthash + nef_checksum + contract_name
-        sender_bytes = account.script_hash.to_array()
-        nef_checksum = nef.checksum.to_bytes(4, 'little')
-        name_bytes = manifest.name.encode('utf-8')
+        # Poll until the tx lands instead of sleeping a fixed block interval.
+        # Anything but a confirmed HALT is a failed deploy: don't record it
+        if tx_hash == "Unknown" or not await wait_for_confirmation(facade, tx_hash):
+            print(f"\n{'='*60}")
+            print("  ERROR: Deployment not confirmed (FAULT or no HALT within 30s)")
+            print(f"{'='*60}")
+            print(f"  Transaction: {tx_hash}")
+            print(f"  {CONFIG_PATH} was not updated")
+            return None
         
-        data = sender_bytes + nef_checksum + name_bytes
-        hash_result = hashlib.sha256(data).digest()
-        hash_result = hashlib.new('ripemd160', hash_result).digest()
-        contract_hash = UInt160(hash_result)
-        contract_hash_str = f"0x{contract_hash}"
+        if not await contract_exists(facade, contract_hash):
+            print(f"  WARNING: {contract_hash_str} not found on chain yet; verify on explorer")
         
         print(f"\n{'='*60}")
         print(f"  Deployment Successful!")
@@ -281,15 +359,17 @@ async def main():
         print("  python deploy_malicious_oracle.py --compile-only")
         sys.exit(1)
     
+    # One account and one facade shared by every mode
+    account = Account.from_wif(args.wif, password='')
+    facade = get_facade()
+    
     if args.check_balance:
-        account = Account.from_wif(args.wif, password='')
         print(f"\n{'='*60}")
         print(f"  Neo N3 Wallet")
         print(f"{'='*60}")
         print(f"  Address: {account.address}")
         print(f"  Script Hash: {account.script_hash}")
         
-        facade = ChainFacade.node_provider_testnet()
         neo_bal, gas_bal = await get_balance(facade, account.script_hash)
         print(f"  Balance: {neo_bal} NEO, {gas_bal:.4f} GAS")
         
@@ -301,7 +381,7 @@ async def main():
         print(f"{'='*60}")
         return
     
-    await deploy_contract(args.wif, args.api_url)
+    await deploy_contract(account, facade, args.api_url)
 
 
 if __name__ == "__main__":
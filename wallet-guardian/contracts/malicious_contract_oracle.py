@@ -8,25 +8,26 @@ This contract allows Neo smart contracts and users to query whether
 an Ethereum contract is malicious before interacting with cross-chain
 bridges or wrapped assets.
 
-Storage Format (per contract address):
-- risk score (0-100, higher = more risky)
-- is_malicious flag (boolean)
-- top 3 detected issues (pipe-separated string)
-- summary explanation (max 200 chars)
-- last update block
+Storage Format (per contract address, one StdLib-serialized record under data_{address}):
+[risk score (0-100, higher = more risky),
+ is_malicious flag (0 or 1),
+ risk level (SAFE/LOW/MEDIUM/HIGH/CRITICAL),
+ top 3 detected issues (pipe-separated string),
+ summary explanation (max 200 chars),
+ last update block]
 
 Oracle Response Format (compact):
 SCORE:85|MAL:true|LEVEL:CRITICAL|I1:reentrancy|I2:rug_pull|I3:honeypot|SUM:Contract has reentrancy vulnerability...
 """
 
 from boa3.sc.compiletime import public
-from boa3.sc.contracts import OracleContract
+from boa3.sc.contracts import OracleContract, StdLib
 from boa3.sc.runtime import check_witness, notify, script_container, calling_script_hash
-from boa3.sc.storage import get_int, get_str, get_uint160, put_int, put_str, put_uint160
+from boa3.sc.storage import get, get_int, get_str, get_uint160, put_bytes, put_int, put_str, put_uint160
 from boa3.sc.types import UInt160
 from boa3.sc.utils import to_bytes, to_str
 from boa3.builtin.interop.blockchain import current_index
-from typing import Any
+from typing import Any, cast
 
 
 # =============================================================================
@@ -37,13 +38,16 @@ OWNER_KEY = b'owner'
 API_URL_KEY = b'api_url'
 TOTAL_SCANS_KEY = b'total_scans'
 
-# Per-contract storage prefixes
-RISK_SCORE_PREFIX = b'score_'      # score_{address} -> int (0-100)
-IS_MALICIOUS_PREFIX = b'mal_'      # mal_{address} -> int (0 or 1)
-ISSUES_PREFIX = b'issues_'         # issues_{address} -> str (pipe-separated)
-SUMMARY_PREFIX = b'sum_'           # sum_{address} -> str (max 200 chars)
-RISK_LEVEL_PREFIX = b'level_'      # level_{address} -> str (SAFE/LOW/MEDIUM/HIGH/CRITICAL)
-LAST_UPDATE_PREFIX = b'update_'    # update_{address} -> int (block number)
+# Per-contract storage prefix: data_{address} -> serialized record
+DATA_PREFIX = b'data_'
+
+# Record field positions
+FIELD_SCORE = 0
+FIELD_MAL = 1
+FIELD_LEVEL = 2
+FIELD_ISSUES = 3
+FIELD_SUMMARY = 4
+FIELD_UPDATE = 5
 
 # Default API URL for Ethereum Sepolia testnet scans
 # The chain=sepolia parameter ensures we scan on the testnet
@@ -78,44 +82,47 @@ def _is_owner() -> bool:
     return check_witness(owner)
 
 
+# =============================================================================
+# Record Storage Helpers
+# =============================================================================
+
+def _store_record(contract_address: str, score: int, is_mal: bool, level: str, issues: str, summary: str):
+    """Write every field for a contract with a single storage put."""
+    # Truncate summary to 200 chars
+    if len(summary) > 200:
+        summary = summary[:197] + "..."
+    record: list = [score, 1 if is_mal else 0, level, issues, summary, current_index]
+    put_bytes(DATA_PREFIX + to_bytes(contract_address), StdLib.serialize(record))
+
+
+def _load_record(contract_address: str) -> list:
+    """Read every field for a contract with a single storage get (empty if never scanned)."""
+    raw = get(DATA_PREFIX + to_bytes(contract_address))
+    if len(raw) == 0:
+        return []
+    return cast(list, StdLib.deserialize(raw))
+
+
 # =============================================================================
 # String Parsing Helpers
 # =============================================================================
 
 def _parse_int(s: str) -> int:
-    """Parse a string to integer."""
+    """Parse a string to integer (digit = byte - ord('0'))."""
     result = 0
     negative = False
     start = 0
+    b = to_bytes(s)
     
-    if len(s) > 0 and s[0] == '-':
+    if len(b) > 0 and b[0] == 45:  # '-'
         negative = True
         start = 1
     
-    for i in range(start, len(s)):
-        c = s[i]
-        if c == '0':
-            result = result * 10 + 0
-        elif c == '1':
-            result = result * 10 + 1
-        elif c == '2':
-            result = result * 10 + 2
-        elif c == '3':
-            result = result * 10 + 3
-        elif c == '4':
-            result = result * 10 + 4
-        elif c == '5':
-            result = result * 10 + 5
-        elif c == '6':
-            result = result * 10 + 6
-        elif c == '7':
-            result = result * 10 + 7
-        elif c == '8':
-            result = result * 10 + 8
-        elif c == '9':
-            result = result * 10 + 9
-        else:
+    for i in range(start, len(b)):
+        d = b[i] - 48
+        if d < 0 or d > 9:
             break  # Stop at non-digit
+        result = result * 10 + d
     
     if negative:
         result = -result
@@ -141,60 +148,70 @@ def _get_value_after_colon(part: str) -> str:
     return ""
 
 
-def _parse_score(response: str) -> int:
-    """Extract score from Oracle response."""
-    parts = response.split("|")
-    for part in parts:
-        if part.startswith("SCORE:"):
-            return _parse_int(_get_value_after_colon(part))
-    return 50
-
-
-def _parse_is_malicious(response: str) -> bool:
-    """Extract is_malicious from Oracle response."""
-    parts = response.split("|")
-    for part in parts:
-        if part.startswith("MAL:"):
-            return _parse_bool(_get_value_after_colon(part))
-    return False
-
-
-def _parse_level(response: str) -> str:
-    """Extract risk level from Oracle response."""
-    parts = response.split("|")
-    for part in parts:
-        if part.startswith("LEVEL:"):
-            return _get_value_after_colon(part)
-    return "UNKNOWN"
-
-
-def _parse_issues(response: str) -> str:
-    """Extract issues from Oracle response."""
-    parts = response.split("|")
-    issues_list: list[str] = []
-    
-    for part in parts:
-        if part.startswith("I1:") or part.startswith("I2:") or part.startswith("I3:"):
-            issues_list.append(_get_value_after_colon(part))
-    
-    # Join issues with pipe (manual join since str.join not supported)
-    if len(issues_list) > 0:
-        issues_str = ""
-        for i in range(len(issues_list)):
-            if i > 0:
-                issues_str = issues_str + "|"
-            issues_str = issues_str + issues_list[i]
-        return issues_str
-    return ""
-
-
-def _parse_summary(response: str) -> str:
-    """Extract summary from Oracle response."""
+def _parse_all(response: str) -> tuple:
+    """
+    Parse every field of the Oracle response in a single pass.
+    
+    Returns:
+        (score, is_malicious, level, issues, summary)
+    """
+    score = 50
+    is_mal = False
+    level = "UNKNOWN"
+    i1 = ""
+    i2 = ""
+    i3 = ""
+    summary = ""
+    
     parts = response.split("|")
-    for part in parts:
-        if part.startswith("SUM:"):
-            return _get_value_after_colon(part)
-    return ""
+    
+    # Fast path: the API emits SCORE|MAL|LEVEL|I1..I3|SUM in fixed order,
+    # with zero to three issue slots, so every field can be read by index.
+    # The fixed slots are checked so a response missing MAL or LEVEL isn't
+    # read shifted by one
+    count = len(parts)
+    last = count - 1
+    if (count >= 4 and count <= 7
+            and parts[0].startswith("SCORE:")
+            and parts[1].startswith("MAL:")
+            and parts[2].startswith("LEVEL:")
+            and parts[last].startswith("SUM:")):
+        score = _parse_int(_get_value_after_colon(parts[0]))
+        is_mal = _parse_bool(_get_value_after_colon(parts[1]))
+        level = _get_value_after_colon(parts[2])
+        if last > 3:
+            i1 = _get_value_after_colon(parts[3])
+        if last > 4:
+            i2 = _get_value_after_colon(parts[4])
+        if last > 5:
+            i3 = _get_value_after_colon(parts[5])
+        summary = _get_value_after_colon(parts[last])
+    else:
+        # Fallback: scan parts in any order
+        for part in parts:
+            if part.startswith("SCORE:"):
+                score = _parse_int(_get_value_after_colon(part))
+            elif part.startswith("MAL:"):
+                is_mal = _parse_bool(_get_value_after_colon(part))
+            elif part.startswith("LEVEL:"):
+                level = _get_value_after_colon(part)
+            elif part.startswith("I1:"):
+                i1 = _get_value_after_colon(part)
+            elif part.startswith("I2:"):
+                i2 = _get_value_after_colon(part)
+            elif part.startswith("I3:"):
+                i3 = _get_value_after_colon(part)
+            elif part.startswith("SUM:"):
+                summary = _get_value_after_colon(part)
+    
+    # Straight-line pipe join (str.join not supported)
+    issues = i1
+    if len(i2) > 0:
+        issues = issues + "|" + i2
+    if len(i3) > 0:
+        issues = issues + "|" + i3
+    
+    return score, is_mal, level, issues, summary
 
 
 # =============================================================================
@@ -298,35 +315,11 @@ def oracle_callback(url: str, user_data: bytes, code: int, result: bytes):
         notify(['OracleEmptyResponse', contract_address])
         return
     
-    # Parse the compact format - extract each field individually
-    score = _parse_score(response_str)
-    is_mal = _parse_is_malicious(response_str)
-    level = _parse_level(response_str)
-    issues = _parse_issues(response_str)
-    summary = _parse_summary(response_str)
-    
-    # Store results
-    score_key = RISK_SCORE_PREFIX + to_bytes(contract_address)
-    put_int(score_key, score)
+    # Parse the compact format in one pass
+    score, is_mal, level, issues, summary = _parse_all(response_str)
     
-    mal_key = IS_MALICIOUS_PREFIX + to_bytes(contract_address)
-    put_int(mal_key, 1 if is_mal else 0)
-    
-    level_key = RISK_LEVEL_PREFIX + to_bytes(contract_address)
-    put_str(level_key, level)
-    
-    issues_key = ISSUES_PREFIX + to_bytes(contract_address)
-    put_str(issues_key, issues)
-    
-    # Truncate summary to 200 chars
-    if len(summary) > 200:
-        summary = summary[:197] + "..."
-    summary_key = SUMMARY_PREFIX + to_bytes(contract_address)
-    put_str(summary_key, summary)
-    
-    # Store update block
-    update_key = LAST_UPDATE_PREFIX + to_bytes(contract_address)
-    put_int(update_key, current_index)
+    # Store results (and update block) in one write
+    _store_record(contract_address, score, is_mal, level, issues, summary)
     
     # Emit event
     notify([
@@ -350,12 +343,10 @@ def get_risk_score(contract_address: str) -> int:
     Returns:
         Risk score 0-100 (100 = highest risk), or -1 if not scanned yet
     """
-    update_key = LAST_UPDATE_PREFIX + to_bytes(contract_address)
-    if get_int(update_key) == 0:
+    record = _load_record(contract_address)
+    if len(record) == 0:
         return -1  # Not scanned yet
-    
-    score_key = RISK_SCORE_PREFIX + to_bytes(contract_address)
-    return get_int(score_key)
+    return cast(int, record[FIELD_SCORE])
 
 
 @public
@@ -366,8 +357,10 @@ def is_malicious(contract_address: str) -> bool:
     Returns:
         True if malicious, False if not scanned or not malicious
     """
-    mal_key = IS_MALICIOUS_PREFIX + to_bytes(contract_address)
-    return get_int(mal_key) == 1
+    record = _load_record(contract_address)
+    if len(record) == 0:
+        return False
+    return cast(int, record[FIELD_MAL]) == 1
 
 
 @public
@@ -378,12 +371,11 @@ def get_risk_level(contract_address: str) -> str:
     Returns:
         "SAFE", "LOW", "MEDIUM", "HIGH", "CRITICAL", or "UNKNOWN"
     """
-    update_key = LAST_UPDATE_PREFIX + to_bytes(contract_address)
-    if get_int(update_key) == 0:
+    record = _load_record(contract_address)
+    if len(record) == 0:
         return "UNKNOWN"
     
-    level_key = RISK_LEVEL_PREFIX + to_bytes(contract_address)
-    level = get_str(level_key)
+    level = cast(str, record[FIELD_LEVEL])
     if len(level) == 0:
         return "UNKNOWN"
     return level
@@ -397,8 +389,10 @@ def get_issues(contract_address: str) -> str:
     Returns:
         String like "reentrancy|rug_pull|honeypot" or empty string
     """
-    issues_key = ISSUES_PREFIX + to_bytes(contract_address)
-    return get_str(issues_key)
+    record = _load_record(contract_address)
+    if len(record) == 0:
+        return ""
+    return cast(str, record[FIELD_ISSUES])
 
 
 @public
@@ -409,8 +403,10 @@ def get_summary(contract_address: str) -> str:
     Returns:
         Summary string (max 200 chars) or empty string
     """
-    summary_key = SUMMARY_PREFIX + to_bytes(contract_address)
-    return get_str(summary_key)
+    record = _load_record(contract_address)
+    if len(record) == 0:
+        return ""
+    return cast(str, record[FIELD_SUMMARY])
 
 
 @public
@@ -421,8 +417,10 @@ def get_last_update(contract_address: str) -> int:
     Returns:
         Block number or 0 if never scanned
     """
-    update_key = LAST_UPDATE_PREFIX + to_bytes(contract_address)
-    return get_int(update_key)
+    record = _load_record(contract_address)
+    if len(record) == 0:
+        return 0
+    return cast(int, record[FIELD_UPDATE])
 
 
 @public
@@ -433,25 +431,29 @@ def get_full_analysis(contract_address: str) -> dict:
     Returns:
         Dict with all stored analysis data
     """
-    update_key = LAST_UPDATE_PREFIX + to_bytes(contract_address)
-    last_update = get_int(update_key)
+    # One storage read returns every field
+    record = _load_record(contract_address)
     
-    if last_update == 0:
+    if len(record) == 0:
         return {
             "contract_address": contract_address,
             "scanned": False,
             "message": "Contract has not been scanned yet. Call request_contract_scan() first."
         }
     
+    level = cast(str, record[FIELD_LEVEL])
+    if len(level) == 0:
+        level = "UNKNOWN"
+    
     return {
         "contract_address": contract_address,
         "scanned": True,
-        "risk_score": get_risk_score(contract_address),
-        "is_malicious": is_malicious(contract_address),
-        "risk_level": get_risk_level(contract_address),
-        "issues": get_issues(contract_address),
-        "summary": get_summary(contract_address),
-        "last_update_block": last_update,
+        "risk_score": record[FIELD_SCORE],
+        "is_malicious": cast(int, record[FIELD_MAL]) == 1,
+        "risk_level": level,
+        "issues": record[FIELD_ISSUES],
+        "summary": record[FIELD_SUMMARY],
+        "last_update_block": record[FIELD_UPDATE],
     }
 
 
@@ -506,28 +508,8 @@ def set_contract_risk_manual(
     if risk_score < 0 or risk_score > 100:
         return False
     
-    # Store all values
-    score_key = RISK_SCORE_PREFIX + to_bytes(contract_address)
-    put_int(score_key, risk_score)
-    
-    mal_key = IS_MALICIOUS_PREFIX + to_bytes(contract_address)
-    put_int(mal_key, 1 if is_mal else 0)
-    
-    level_key = RISK_LEVEL_PREFIX + to_bytes(contract_address)
-    put_str(level_key, risk_level)
-    
-    issues_key = ISSUES_PREFIX + to_bytes(contract_address)
-    put_str(issues_key, issues)
-    
-    # Truncate summary
-    if len(summary) > 200:
-        summary = summary[:197] + "..."
-    summary_key = SUMMARY_PREFIX + to_bytes(contract_address)
-    put_str(summary_key, summary)
-    
-    # Store update block
-    update_key = LAST_UPDATE_PREFIX + to_bytes(contract_address)
-    put_int(update_key, current_index)
+    # Store all values (and update block) in one write
+    _store_record(contract_address, risk_score, is_mal, risk_level, issues, summary)
     
     notify(['ManualRiskSet', contract_address, risk_score, is_mal, risk_level])
     return True
@@ -16,14 +16,17 @@ from typing import Any
 
 # Storage Keys
 OWNER_KEY = b'owner'
-RISK_SCORE_PREFIX = b'risk_'
-LAST_UPDATE_PREFIX = b'update_'
+RISK_SCORE_PREFIX = b'risk_'  # value: (last update block << 8) | score
 API_URL_KEY = b'api_url'
 TOTAL_REQUESTS_KEY = b'total_requests'
 
 DEFAULT_API_URL = "https://wallet-guardian.example.com/api/v2/analyze/"
 GAS_FOR_RESPONSE = 100000000  # 1 GAS
 
+DEFAULT_SCORE = 50
+# Risk level by score // 20 (0-100): <40 CRITICAL, <60 HIGH, <80 MEDIUM, else LOW
+RISK_LEVELS = ["CRITICAL", "CRITICAL", "HIGH", "MEDIUM", "LOW", "LOW"]
+
 
 # =============================================================================
 # Contract Deployment
@@ -47,40 +50,29 @@ def _is_owner() -> bool:
 
 
 def _get_risk_level(score: int) -> str:
-    """Convert score to risk level."""
-    if score >= 80:
-        return "LOW"
-    if score >= 60:
-        return "MEDIUM"
-    if score >= 40:
-        return "HIGH"
-    return "CRITICAL"
-
-
-def _parse_int(s: str) -> int:
-    """Parse a string to integer without using ord()."""
+    """Convert a 0-100 score to risk level."""
+    return RISK_LEVELS[score // 20]
+
+
+def _pack(score: int, block: int) -> int:
+    """Pack a 0-100 score and its update block into one storage value."""
+    return (block << 8) | score
+
+
+def _parse_score(raw: bytes) -> int:
+    """
+    Parse the oracle's score bytes straight to a 0-100 score, skipping
+    non-digits. Empty or zero results fall back to DEFAULT_SCORE.
+    """
     result = 0
-    for c in s:
-        if c == '0':
-            result = result * 10 + 0
-        elif c == '1':
-            result = result * 10 + 1
-        elif c == '2':
-            result = result * 10 + 2
-        elif c == '3':
-            result = result * 10 + 3
-        elif c == '4':
-            result = result * 10 + 4
-        elif c == '5':
-            result = result * 10 + 5
-        elif c == '6':
-            result = result * 10 + 6
-        elif c == '7':
-            result = result * 10 + 7
-        elif c == '8':
-            result = result * 10 + 8
-        elif c == '9':
-            result = result * 10 + 9
+    for i in range(len(raw)):
+        d = raw[i] - 48
+        if d >= 0 and d <= 9:
+            result = result * 10 + d
+    if result == 0:
+        return DEFAULT_SCORE
+    if result > 100:
+        return 100
     return result
 
 
@@ -146,29 +138,14 @@ def oracle_callback(url: str, user_data: bytes, code: int, result: bytes):
         notify(['OracleError', address, code])
         return
     
-    # Parse score - default to 50
-    score = 50
-    if len(result) > 0:
-        score_str = to_str(result)
-        if len(score_str) > 0:
-            temp_score = _parse_int(score_str)
-            if temp_score > 0:
-                score = temp_score
+    score = _parse_score(result)
     
-    if score > 100:
-        score = 100
-    
-    # Store score
-    score_key = RISK_SCORE_PREFIX + to_bytes(address)
-    put_int(score_key, score)
-
-    # Store update block
-    update_key = LAST_UPDATE_PREFIX + to_bytes(address)
-    put_int(update_key, current_index)
+    # user_data already holds the address bytes; no to_bytes round trip.
+    # Score and update block share one slot: a single storage write.
+    put_int(RISK_SCORE_PREFIX + user_data, _pack(score, current_index))
     
     # Emit event
-    risk_level = _get_risk_level(score)
-    notify(['RiskScoreUpdated', address, score, risk_level])
+    notify(['RiskScoreUpdated', address, score, RISK_LEVELS[score // 20]])
 
 
 # =============================================================================
@@ -178,21 +155,17 @@ def oracle_callback(url: str, user_data: bytes, code: int, result: bytes):
 @public
 def get_risk_score(address: str) -> int:
     """Get stored risk score. Returns -1 if not set."""
-    score_key = RISK_SCORE_PREFIX + to_bytes(address)
-    update_key = LAST_UPDATE_PREFIX + to_bytes(address)
-    
-    update = get_int(update_key)
-    if update == 0:
+    packed = get_int(RISK_SCORE_PREFIX + to_bytes(address))
+    if packed == 0:
         return -1
     
-    return get_int(score_key)
+    return packed & 0xFF
 
 
 @public
 def get_last_update(address: str) -> int:
     """Get block when score was last updated."""
-    update_key = LAST_UPDATE_PREFIX + to_bytes(address)
-    return get_int(update_key)
+    return get_int(RISK_SCORE_PREFIX + to_bytes(address)) >> 8
 
 
 @public
@@ -223,11 +196,7 @@ def set_risk_score_manual(address: str, score: int) -> bool:
     if score < 0 or score > 100:
         return False
     
-    score_key = RISK_SCORE_PREFIX + to_bytes(address)
-    put_int(score_key, score)
-    
-    update_key = LAST_UPDATE_PREFIX + to_bytes(address)
-    put_int(update_key, current_index)
+    put_int(RISK_SCORE_PREFIX + to_bytes(address), _pack(score, current_index))
     
     risk_level = _get_risk_level(score)
     notify(['RiskScoreUpdated', address, score, risk_level])
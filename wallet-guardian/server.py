@@ -5,30 +5,69 @@ This server exposes the Wallet Guardian agent via HTTP endpoints with optional
 x402 payment support on Base Sepolia.
 
 Usage:
-    # Development
+    # Development (WORKERS=$(nproc) to use every core)
     python server.py
 
     # Production
-    uvicorn server:app --host 0.0.0.0 --port 8000
+    uvicorn server:app --loop uvloop --http httptools --no-access-log --backlog 4096 --host 0.0.0.0 --port 8000 --workers $(nproc)
 """
 
 import os
+import sys
 import json
 import asyncio
-from typing import Optional
+import logging
+from typing import Literal, Optional
 from contextlib import asynccontextmanager
 
+import httpx
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request, Header
+from fastapi import Depends, FastAPI, HTTPException, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 # Load environment variables
 load_dotenv(override=True)
 
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+# Level checks resolved once, so hot-path debug logging costs a bool test
+_IS_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
 # Import agent and tools
-from src.agent import register_agent, AGENT_NAME, get_tools, build_agent
+from src.agent import register_agent, AGENT_NAME, build_agent
+from src.cache import AnalysisCache
+from src.config import USE_MOCK, get_elevenlabs_api_key
+from src.advanced_features import (
+    AlertPriority,
+    PortfolioAnalyzer,
+    PortfolioWallet,
+    PredictiveRiskAnalyzer,
+    RealTimeMonitor,
+    SmartAlertSystem,
+    build_relationship_graph,
+)
+from src.eth_client import Chain, analyze_eth_wallet, detect_chain, is_valid_eth_address
+from src.graph_orchestrator import analyze_wallet
+from src.neo_client import NeoClient, aclose_shared_pools
+from src.SusInspector import SusInspector
+from src.tools import GetWalletSummaryTool
+from src.tools.known_malicious_contracts import KNOWN_MALICIOUS_CONTRACTS, TRUSTED_CONTRACTS
+from src.tools.malicious_contract_detector import MaliciousContractDetectorTool, format_for_oracle
+from src.voice_guardian import (
+    AlertSeverity,
+    VoiceGuardian,
+    VoicePersona,
+    VoicePool,
+    audio_to_base64,
+    audio_to_base64_chunks,
+)
 
 # Global agent instance (lazy initialization)
 _agent = None
@@ -85,21 +124,83 @@ class HealthResponse(BaseModel):
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     # Startup
-    print(f"Starting Assertion OS x402 Gateway...")
-    print(f"Agent: {AGENT_NAME}")
-    print(f"Tools: {[t.name for t in get_tools()]}")
+    logger.info("Starting Assertion OS x402 Gateway (agent=%s)", AGENT_NAME)
     
-    x402_enabled = bool(os.getenv("X402_AGENT_PRIVATE_KEY"))
-    print(f"x402 Payments: {'Enabled' if x402_enabled else 'Disabled (free mode)'}")
+    # Environment doesn't change at runtime: resolve config and tool names once
+    app.state.x402_config = _build_x402_config()
+    app.state.x402_enabled = app.state.x402_config["enabled"]
+    app.state.agent_descriptor = register_agent()
+    app.state.tool_names = tuple(app.state.agent_descriptor["tools"])
     
-    if x402_enabled:
-        print(f"Network: {os.getenv('X402_DEFAULT_NETWORK', 'base-sepolia')}")
-        print(f"Price: {os.getenv('X402_DEFAULT_AMOUNT_USDC', '0.01')} USDC")
+    # Constant payloads: serialize once, serve the bytes as-is
+    app.state.agents_body = orjson.dumps({"agents": [app.state.agent_descriptor]})
+    app.state.health_body = orjson.dumps({
+        "status": "healthy",
+        "agent": AGENT_NAME,
+        "tools": list(app.state.tool_names),
+        "x402_enabled": app.state.x402_config["enabled"],
+    })
+    app.state.requirements_body = orjson.dumps(
+        _payment_requirements(app.state.x402_config)
+    )
+    app.state.known_malicious_body = orjson.dumps(_known_malicious_payload())
+    app.state.payment_required_body = orjson.dumps({
+        "error": "Payment Required",
+        "requirements": {
+            "network": app.state.x402_config["network"],
+            "amount": app.state.x402_config["amount"],
+            "asset": app.state.x402_config["asset"],
+            "payTo": app.state.x402_config["receiver"],
+        },
+    })
+    logger.info("Tools: %s", ", ".join(app.state.tool_names))
+    
+    if app.state.x402_config["enabled"]:
+        logger.info(
+            "x402 payments enabled (network=%s, price=%s USDC)",
+            app.state.x402_config["network"],
+            app.state.x402_config["amount"],
+        )
+    else:
+        logger.info("x402 payments disabled (free mode)")
+    
+    # Neo RPC client for request handlers; every NeoClient in the process
+    # (fetchers, tools, analyzers) shares one keep-alive HTTP/2 pool per URL
+    app.state.neo_client = NeoClient()
+    # Stateless sync helpers reused across requests (run via to_thread)
+    app.state.sus_inspector = SusInspector(app.state.neo_client)
+    app.state.summary_tool = GetWalletSummaryTool()
+    app.state.portfolio_analyzer = PortfolioAnalyzer()
+    # Pooled outbound client for ElevenLabs: keep-alive + TLS session reuse
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300),
+        timeout=httpx.Timeout(30.0),
+    )
+    # Build the voice guardian (import + client wiring) before the first
+    # request rather than on it; without an API key it stays lazy
+    app.state.voice = get_voice_guardian_instance() if get_elevenlabs_api_key() else None
+    app.state.voice_pool = None
+    if app.state.voice is not None:
+        app.state.voice_pool = VoicePool(app.state.voice)
+        await app.state.voice_pool.start()
+    app.state.analyze_cache = AnalysisCache(
+        max_entries=int(os.getenv("ANALYZE_CACHE_MAX_ENTRIES", "4096")),
+        ttl_seconds=float(os.getenv("ANALYZE_CACHE_TTL_SECONDS", "60")),
+    )
+    # ElevenLabs account/voice metadata polled by dashboards; the voice list
+    # changes far less often than the character count
+    app.state.voice_status_cache = AnalysisCache(max_entries=1, ttl_seconds=60)
+    app.state.voice_list_cache = AnalysisCache(max_entries=1, ttl_seconds=600)
     
     yield
     
     # Shutdown
-    print("Shutting down Assertion OS Gateway...")
+    logger.info("Shutting down Assertion OS Gateway")
+    if app.state.voice_pool is not None:
+        await app.state.voice_pool.stop()
+    await aclose_shared_pools()
+    await app.state.http.aclose()
 
 
 app = FastAPI(
@@ -107,24 +208,52 @@ app = FastAPI(
     description="AI-powered wallet analysis agent for Neo N3 with x402 payment support",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+class StreamBypassGZipMiddleware(GZipMiddleware):
+    """
+    GZip for buffered responses; */stream endpoints pass through untouched.
+    
+    Raw MP3 doesn't compress, and gzip's internal buffering would hold back
+    the first audio bytes that streaming exists to deliver early.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# CORS middleware. ALLOWED_ORIGINS is a comma-separated list (default "*");
+# max_age lets browsers cache the preflight instead of sending one per call
+ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization", "x-payment"],
+    max_age=86400,
 )
 
+# Voice responses are mostly base64 text (~25% smaller gzipped); the size
+# floor keeps health checks and other small bodies uncompressed
+app.add_middleware(StreamBypassGZipMiddleware, minimum_size=8192, compresslevel=4)
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_x402_config() -> dict:
-    """Get x402 configuration from environment."""
+def get_neo_client(request: Request) -> NeoClient:
+    """Shared NeoClient bound to app state in the lifespan handler."""
+    return request.app.state.neo_client
+
+
+def _build_x402_config() -> dict:
+    """Build x402 configuration from environment (called once in lifespan)."""
     receiver = os.getenv("X402_RECEIVER_ADDRESS", "")
     return {
         # Enable x402 if receiver address is configured (even without private key for demo)
@@ -138,15 +267,13 @@ def get_x402_config() -> dict:
     }
 
 
-def verify_payment(payment_header: Optional[str]) -> bool:
+def verify_payment(payment_header: Optional[str], config: dict) -> bool:
     """
     Verify x402 payment header.
     
     In production, this would verify the signature and check with the facilitator.
     For hackathon demo, we'll accept any non-empty header or skip if x402 is disabled.
     """
-    config = get_x402_config()
-    
     if not config["enabled"]:
         # x402 disabled - free mode
         return True
@@ -163,42 +290,31 @@ def verify_payment(payment_header: Optional[str]) -> bool:
 # Endpoints
 # =============================================================================
 
-@app.get("/", response_model=HealthResponse)
-async def root():
+@app.get("/", responses={200: {"model": HealthResponse}})
+async def root(http_request: Request):
     """Root endpoint with health check."""
-    config = get_x402_config()
-    return HealthResponse(
-        status="healthy",
-        agent=AGENT_NAME,
-        tools=[t.name for t in get_tools()],
-        x402_enabled=config["enabled"],
-    )
+    return Response(content=http_request.app.state.health_body, media_type="application/json")
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health():
+@app.get("/health", responses={200: {"model": HealthResponse}})
+async def health(http_request: Request):
     """Health check endpoint."""
-    config = get_x402_config()
-    return HealthResponse(
-        status="healthy",
-        agent=AGENT_NAME,
-        tools=[t.name for t in get_tools()],
-        x402_enabled=config["enabled"],
-    )
+    return Response(content=http_request.app.state.health_body, media_type="application/json")
 
 
 @app.get("/x402/requirements")
-async def get_payment_requirements():
+async def get_payment_requirements(http_request: Request):
     """Return x402 payment requirements."""
-    config = get_x402_config()
-    
+    return Response(content=http_request.app.state.requirements_body, media_type="application/json")
+
+
+def _payment_requirements(config: dict) -> dict:
+    """Build the x402 requirements payload (called once in lifespan)."""
     if not config["enabled"]:
-        return JSONResponse(
-            content={
-                "enabled": False,
-                "message": "x402 payments not configured - free mode active"
-            }
-        )
+        return {
+            "enabled": False,
+            "message": "x402 payments not configured - free mode active"
+        }
     
     return {
         "enabled": True,
@@ -224,6 +340,7 @@ async def get_payment_requirements():
 async def invoke_agent(
     agent_name: str,
     request: InvokeRequest,
+    http_request: Request,
     x_payment: Optional[str] = Header(None, alias="X-PAYMENT"),
 ):
     """
@@ -238,28 +355,26 @@ async def invoke_agent(
             detail=f"Agent '{agent_name}' not found. Available: {AGENT_NAME}"
         )
     
-    # Check payment if x402 is enabled
-    config = get_x402_config()
-    if config["enabled"] and not verify_payment(x_payment):
-        return JSONResponse(
+    # Check payment if x402 is enabled (free mode skips verification entirely;
+    # the 402 body is prebuilt at startup)
+    state = http_request.app.state
+    if state.x402_enabled and not verify_payment(x_payment, state.x402_config):
+        return Response(
+            content=state.payment_required_body,
             status_code=402,
-            content={
-                "error": "Payment Required",
-                "requirements": {
-                    "network": config["network"],
-                    "amount": config["amount"],
-                    "asset": config["asset"],
-                    "payTo": config["receiver"],
-                }
-            },
+            media_type="application/json",
             headers={
                 "X-Payment-Required": "true",
             }
         )
     
-    # Set mock mode if requested
-    if request.use_mock:
-        os.environ["WALLET_GUARDIAN_USE_MOCK"] = "true"
+    return await _run_agent(agent_name, request)
+
+
+async def _run_agent(agent_name: str, request: InvokeRequest) -> InvokeResponse:
+    """Run the agent for a prompt (payment already checked by the caller)."""
+    # Mock mode is scoped to this request's context; tools read it via USE_MOCK
+    mock_token = USE_MOCK.set(request.use_mock)
     
     try:
         # Use the actual SpoonOS agent for LLM-powered reasoning
@@ -274,6 +389,8 @@ async def invoke_agent(
         
         if hasattr(agent, 'tool_calls') and agent.tool_calls:
             tools_used = [tc.function.name for tc in agent.tool_calls if hasattr(tc, 'function')]
+        if _IS_DEBUG:
+            logger.debug("Agent %s used tools: %s", agent_name, tools_used)
         
         # Extract reasoning from memory if available
         if hasattr(agent, 'memory') and hasattr(agent.memory, 'messages'):
@@ -302,9 +419,7 @@ async def invoke_agent(
             detail=f"Agent execution failed: {str(e)}"
         )
     finally:
-        # Reset mock mode
-        if "WALLET_GUARDIAN_USE_MOCK" in os.environ:
-            del os.environ["WALLET_GUARDIAN_USE_MOCK"]
+        USE_MOCK.reset(mock_token)
 
 
 @app.post("/analyze")
@@ -313,16 +428,21 @@ async def analyze_wallet_simple(request: InvokeRequest):
     Simplified endpoint for wallet analysis (no x402 required).
     Useful for testing and demos.
     """
-    # Redirect to the main invoke endpoint
-    return await invoke_agent(AGENT_NAME, request)
+    # Same agent run as the x402 endpoint, minus the payment check
+    return await _run_agent(AGENT_NAME, request)
 
 
 @app.get("/agents")
-async def list_agents():
+async def list_agents(http_request: Request):
     """List available agents."""
-    return {
-        "agents": [register_agent()]
-    }
+    # Descriptor is fixed for the process lifetime; serve the bytes built at startup
+    return Response(content=http_request.app.state.agents_body, media_type="application/json")
+
+
+@app.get("/metrics")
+async def metrics(http_request: Request):
+    """Analysis cache counters."""
+    return http_request.app.state.analyze_cache.stats()
 
 
 # =============================================================================
@@ -349,6 +469,42 @@ class GraphRequest(BaseModel):
     lookback_days: int = 30
 
 
+class GraphNodeOut(BaseModel):
+    """Relationship graph node, read straight off the WalletNode dataclass."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    
+    address: str
+    label: str
+    risk_score: Optional[int] = None
+    total_volume: float
+    is_monitored: bool
+    node_type: str
+
+
+class GraphEdgeOut(BaseModel):
+    """Relationship graph edge, read straight off the WalletEdge dataclass."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    
+    from_address: str = Field(serialization_alias="from")
+    to_address: str = Field(serialization_alias="to")
+    transaction_count: int
+    total_volume: float
+    last_activity: float
+    relationship_type: str
+
+
+class GraphResponse(BaseModel):
+    """Response for the relationship graph endpoint."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    
+    nodes: list[GraphNodeOut]
+    edges: list[GraphEdgeOut]
+    clusters: list[dict]
+    central_addresses: list[str]
+    suspicious_relationships: list[dict]
+    graph_density: float
+
+
 class MonitorRequest(BaseModel):
     """Request to add/remove monitored wallet."""
     address: str
@@ -363,6 +519,8 @@ class AlertRuleRequest(BaseModel):
     wallets: list[str] | None = None
 
 
+_PRIORITY_BY_NAME = {p.name.lower(): p for p in AlertPriority}
+
 # Global instances for stateful features
 _monitor_instance = None
 _alert_system_instance = None
@@ -371,7 +529,6 @@ _alert_system_instance = None
 def get_monitor():
     global _monitor_instance
     if _monitor_instance is None:
-        from src.advanced_features import RealTimeMonitor
         _monitor_instance = RealTimeMonitor()
     return _monitor_instance
 
@@ -379,13 +536,17 @@ def get_monitor():
 def get_alert_system():
     global _alert_system_instance
     if _alert_system_instance is None:
-        from src.advanced_features import SmartAlertSystem
         _alert_system_instance = SmartAlertSystem()
     return _alert_system_instance
 
 
 @app.post("/api/v2/analyze/{address}")
-async def analyze_wallet_v2(address: str, lookback_days: int = 30, chain: str = "auto"):
+async def analyze_wallet_v2(
+    address: str,
+    http_request: Request,
+    lookback_days: int = 30,
+    chain: str = "auto",
+):
     """
     Analyze a single wallet using the graph orchestrator.
     
@@ -396,8 +557,6 @@ async def analyze_wallet_v2(address: str, lookback_days: int = 30, chain: str =
     Returns comprehensive risk analysis with computation graph metrics.
     """
     try:
-        from src.eth_client import detect_chain, Chain, EthClient, analyze_eth_wallet
-        
         # Auto-detect chain from address format
         if chain == "auto":
             detected = detect_chain(address)
@@ -411,15 +570,21 @@ async def analyze_wallet_v2(address: str, lookback_days: int = 30, chain: str =
                     detail=f"Could not detect chain for address: {address}. Use 'chain' parameter."
                 )
         
+        cache = http_request.app.state.analyze_cache
+        
         # Route to appropriate analyzer
         if chain == "ethereum":
-            result = analyze_eth_wallet(address)
-            return JSONResponse(content=result)
+            async def compute():
+                return analyze_eth_wallet(address)
+            result = await cache.get_or_compute(("analyze", "ethereum", address), compute)
+            return ORJSONResponse(content=result)
         else:
             # Neo N3 - use graph orchestrator
-            from src.graph_orchestrator import analyze_wallet
-            result = await analyze_wallet(address, lookback_days)
-            return JSONResponse(content=result)
+            result = await cache.get_or_compute(
+                ("analyze", "neo3", address, lookback_days),
+                lambda: analyze_wallet(address, lookback_days),
+            )
+            return ORJSONResponse(content=result)
             
     except HTTPException:
         raise
@@ -428,7 +593,7 @@ async def analyze_wallet_v2(address: str, lookback_days: int = 30, chain: str =
 
 
 @app.post("/api/v2/portfolio")
-async def analyze_portfolio_endpoint(request: PortfolioRequest):
+async def analyze_portfolio_endpoint(request: PortfolioRequest, http_request: Request):
     """
     Analyze multiple wallets as a portfolio.
     
@@ -439,16 +604,13 @@ async def analyze_portfolio_endpoint(request: PortfolioRequest):
     - Diversification scoring
     """
     try:
-        from src.advanced_features import analyze_portfolio, PortfolioWallet
+        wallets = [PortfolioWallet(w["address"], w.get("label", "")) for w in request.wallets]
         
-        wallets = [
-            {"address": w["address"], "label": w.get("label", "")}
-            for w in request.wallets
-        ]
-        
-        result = await analyze_portfolio(wallets)
+        result = await http_request.app.state.portfolio_analyzer.analyze_portfolio(
+            wallets, request.lookback_days
+        )
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "total_value_usd": result.total_value_usd,
             "weighted_risk_score": result.weighted_risk_score,
             "risk_level": result.risk_level,
@@ -465,7 +627,11 @@ async def analyze_portfolio_endpoint(request: PortfolioRequest):
 
 
 @app.post("/api/v2/predict/{address}")
-async def predict_risk_endpoint(address: str, request: PredictRequest = None):
+async def predict_risk_endpoint(
+    address: str,
+    http_request: Request,
+    request: PredictRequest = None,
+):
     """
     Predict future risk score using time-series analysis.
     
@@ -476,30 +642,32 @@ async def predict_risk_endpoint(address: str, request: PredictRequest = None):
     - Risk factor identification
     """
     try:
-        from src.advanced_features import predict_risk
-        
         lookback = request.lookback_days if request else 90
         forecast = request.forecast_days if request else 7
         
-        from src.advanced_features import PredictiveRiskAnalyzer
-        analyzer = PredictiveRiskAnalyzer()
-        result = await analyzer.analyze_trend(address, lookback, forecast)
+        async def compute():
+            analyzer = PredictiveRiskAnalyzer()
+            result = await analyzer.analyze_trend(address, lookback, forecast)
+            return {
+                "current_score": result.current_score,
+                "predicted_score": result.predicted_score,
+                "trend_direction": result.trend_direction,
+                "confidence": result.confidence,
+                "forecast_days": result.forecast_days,
+                "historical_scores": result.historical_scores,
+                "risk_factors": result.risk_factors,
+                "recommendation": result.recommendation,
+            }
         
-        return JSONResponse(content={
-            "current_score": result.current_score,
-            "predicted_score": result.predicted_score,
-            "trend_direction": result.trend_direction,
-            "confidence": result.confidence,
-            "forecast_days": result.forecast_days,
-            "historical_scores": result.historical_scores,
-            "risk_factors": result.risk_factors,
-            "recommendation": result.recommendation,
-        })
+        content = await http_request.app.state.analyze_cache.get_or_compute(
+            ("predict", address, lookback, forecast), compute
+        )
+        return ORJSONResponse(content=content)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/v2/graph")
+@app.post("/api/v2/graph", responses={200: {"model": GraphResponse}})
 async def build_graph_endpoint(request: GraphRequest):
     """
     Build a wallet relationship graph.
@@ -511,25 +679,15 @@ async def build_graph_endpoint(request: GraphRequest):
     - Suspicious relationship flagging
     """
     try:
-        from src.advanced_features import build_relationship_graph
-        
         result = await build_relationship_graph(
             request.addresses, 
             depth=request.depth
         )
         
-        return JSONResponse(content={
-            "nodes": [
-                {
-                    "address": n.address,
-                    "label": n.label,
-                    "risk_score": n.risk_score,
-                    "total_volume": n.total_volume,
-                    "is_monitored": n.is_monitored,
-                    "node_type": n.node_type,
-                }
-                for n in result.nodes
-            ],
+        # orjson walks the slotted WalletNode dataclasses directly (field names
+        # are the wire names); edges only need their endpoints renamed
+        body = orjson.dumps({
+            "nodes": result.nodes,
             "edges": [
                 {
                     "from": e.from_address,
@@ -545,7 +703,8 @@ async def build_graph_endpoint(request: GraphRequest):
             "central_addresses": result.central_addresses,
             "suspicious_relationships": result.suspicious_relationships,
             "graph_density": result.graph_density,
-        })
+        }, option=orjson.OPT_NON_STR_KEYS)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -559,10 +718,10 @@ async def manage_monitor(request: MonitorRequest):
     
     if request.action == "add":
         monitor.add_wallet(request.address)
-        return {"status": "added", "address": request.address}
+        return ORJSONResponse(content={"status": "added", "address": request.address})
     elif request.action == "remove":
         monitor.remove_wallet(request.address)
-        return {"status": "removed", "address": request.address}
+        return ORJSONResponse(content={"status": "removed", "address": request.address})
     else:
         raise HTTPException(status_code=400, detail="Invalid action. Use 'add' or 'remove'.")
 
@@ -575,7 +734,7 @@ async def check_monitored_wallets():
     try:
         monitor = get_monitor()
         events = await monitor.monitor_once()
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "events": [e.to_dict() for e in events],
             "monitored_wallets": list(monitor.monitored_wallets.keys()),
         })
@@ -592,19 +751,11 @@ async def get_alerts(
     """
     Get triggered alerts with optional filters.
     """
-    from src.advanced_features import AlertPriority
-    
     alert_system = get_alert_system()
     
     priority_enum = None
     if priority:
-        priority_map = {
-            "low": AlertPriority.LOW,
-            "medium": AlertPriority.MEDIUM,
-            "high": AlertPriority.HIGH,
-            "critical": AlertPriority.CRITICAL,
-        }
-        priority_enum = priority_map.get(priority.lower())
+        priority_enum = _PRIORITY_BY_NAME.get(priority.lower())
     
     alerts = alert_system.get_alerts(
         wallet=wallet,
@@ -612,7 +763,7 @@ async def get_alerts(
         unacknowledged_only=unacknowledged_only
     )
     
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "alerts": [
             {
                 "id": a.id,
@@ -640,7 +791,7 @@ async def evaluate_alerts_for_wallet(address: str):
         alert_system = get_alert_system()
         alerts = await alert_system.evaluate_wallet(address)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "triggered_alerts": [
                 {
                     "id": a.id,
@@ -663,7 +814,7 @@ async def acknowledge_alert(alert_id: str):
     """
     alert_system = get_alert_system()
     alert_system.acknowledge_alert(alert_id)
-    return {"status": "acknowledged", "alert_id": alert_id}
+    return ORJSONResponse(content={"status": "acknowledged", "alert_id": alert_id})
 
 
 @app.post("/api/v2/alerts/rules")
@@ -676,29 +827,23 @@ async def create_alert_rule(request: AlertRuleRequest):
     - "balance_change_percent < -20"
     - "counterparty_count > 100"
     """
-    from src.advanced_features import AlertPriority
-    
-    priority_map = {
-        "low": AlertPriority.LOW,
-        "medium": AlertPriority.MEDIUM,
-        "high": AlertPriority.HIGH,
-        "critical": AlertPriority.CRITICAL,
-    }
-    
     alert_system = get_alert_system()
-    rule = alert_system.create_custom_rule(
-        name=request.name,
-        condition_expr=request.condition,
-        priority=priority_map.get(request.priority.lower(), AlertPriority.MEDIUM),
-        wallets=request.wallets
-    )
+    try:
+        rule = alert_system.create_custom_rule(
+            name=request.name,
+            condition_expr=request.condition,
+            priority=_PRIORITY_BY_NAME.get(request.priority.lower(), AlertPriority.MEDIUM),
+            wallets=request.wallets
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return {
+    return ORJSONResponse(content={
         "rule_id": rule.id,
         "name": rule.name,
         "condition": request.condition,
         "priority": request.priority,
-    }
+    })
 
 
 @app.get("/api/v2/alerts/rules")
@@ -707,7 +852,7 @@ async def list_alert_rules():
     List all alert rules.
     """
     alert_system = get_alert_system()
-    return {
+    return ORJSONResponse(content={
         "rules": [
             {
                 "id": r.id,
@@ -719,17 +864,21 @@ async def list_alert_rules():
             }
             for r in alert_system.rules.values()
         ]
-    }
+    })
 
 
 # =============================================================================
 # Voice Guardian API (ElevenLabs Integration)
 # =============================================================================
 
+VoiceSeverityName = Literal["info", "warning", "critical", "emergency"]
+VoicePersonaName = Literal["professional", "friendly", "urgent", "concise"]
+
+
 class VoiceAlertRequest(BaseModel):
     """Request for voice alert."""
     message: str
-    severity: str = "info"  # info, warning, critical, emergency
+    severity: VoiceSeverityName = "info"
     address: str | None = None
 
 
@@ -750,7 +899,18 @@ class VoiceQueryRequest(BaseModel):
     """Request for voice query response."""
     query: str
     response: str
-    persona: str = "professional"  # professional, friendly, urgent, concise
+    persona: VoicePersonaName = "professional"
+
+
+# API severity names -> voice severity (HIGH/CRITICAL pick the urgent voice
+# and "Attention!"/"Emergency!" prefixes)
+_VOICE_SEVERITY: dict[str, AlertSeverity] = {
+    "info": AlertSeverity.LOW,
+    "warning": AlertSeverity.MEDIUM,
+    "critical": AlertSeverity.HIGH,
+    "emergency": AlertSeverity.CRITICAL,
+}
+_VOICE_PERSONA: dict[str, VoicePersona] = {p.value: p for p in VoicePersona}
 
 
 # Global voice guardian instance
@@ -761,18 +921,30 @@ def get_voice_guardian_instance():
     """Get or create global voice guardian instance."""
     global _voice_guardian_instance
     if _voice_guardian_instance is None:
-        from src.voice_guardian import VoiceGuardian
-        _voice_guardian_instance = VoiceGuardian()
+        _voice_guardian_instance = VoiceGuardian(http_client=app.state.http)
     return _voice_guardian_instance
 
 
+def get_voice(request: Request):
+    """Voice guardian built in the lifespan handler (lazy fallback without an API key)."""
+    return request.app.state.voice or get_voice_guardian_instance()
+
+
+async def get_voice_pool(request: Request):
+    """TTS request pool started in the lifespan handler (lazy fallback without an API key)."""
+    if request.app.state.voice_pool is None:
+        request.app.state.voice_pool = VoicePool(get_voice_guardian_instance())
+        await request.app.state.voice_pool.start()
+    return request.app.state.voice_pool
+
+
 @app.get("/api/v2/voice/status")
-async def voice_status():
+async def voice_status(http_request: Request):
     """
     Check voice guardian status and ElevenLabs API availability.
-    """
-    from src.config import get_elevenlabs_api_key
     
+    Subscription info is cached for 60 seconds.
+    """
     api_key = get_elevenlabs_api_key()
     has_key = bool(api_key)
     
@@ -792,8 +964,10 @@ async def voice_status():
     # Try to get user info if API key is available
     if has_key:
         try:
-            voice = get_voice_guardian_instance()
-            user_info = await voice.client.get_user_info()
+            voice = get_voice(http_request)
+            user_info = await http_request.app.state.voice_status_cache.get_or_compute(
+                "user_info", voice.client.get_user_info
+            )
             result["subscription"] = {
                 "tier": user_info.get("subscription", {}).get("tier", "unknown"),
                 "character_count": user_info.get("subscription", {}).get("character_count", 0),
@@ -805,13 +979,20 @@ async def voice_status():
     return result
 
 
+@app.get("/api/v2/voice/cache/stats")
+async def voice_cache_stats(voice=Depends(get_voice)):
+    """TTS audio cache counters."""
+    return ORJSONResponse(voice.client.cache_stats())
+
+
 @app.get("/api/v2/voice/voices")
-async def list_voices():
+async def list_voices(http_request: Request, voice=Depends(get_voice)):
     """
     List available ElevenLabs voices.
+    
+    The list is cached for 10 minutes.
     """
-    try:
-        voice = get_voice_guardian_instance()
+    async def fetch_voices():
         voices = await voice.client.get_voices()
         return {
             "voices": [
@@ -824,104 +1005,146 @@ async def list_voices():
                 for v in voices
             ]
         }
+    
+    try:
+        return await http_request.app.state.voice_list_cache.get_or_compute("voices", fetch_voices)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _voice_json_response(payload: dict, audio: bytes) -> StreamingResponse:
+    """
+    Stream a voice payload as JSON, base64-encoding the audio chunk by chunk.
+    
+    The body equals {**payload, "audio_data": audio_to_base64(audio)}, but the
+    full base64 string and JSON document are never held in memory at once.
+    """
+    head = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)[:-1] + b',"audio_data":"'
+    
+    async def body():
+        yield head
+        for chunk in audio_to_base64_chunks(audio):
+            yield chunk
+        yield b'"}'
+    
+    return StreamingResponse(body(), media_type="application/json")
+
+
 @app.post("/api/v2/voice/speak/alert")
-async def speak_alert_endpoint(request: VoiceAlertRequest):
+async def speak_alert_endpoint(request: VoiceAlertRequest, pool=Depends(get_voice_pool)):
     """
     Generate voice audio for an alert message.
     
     Returns base64-encoded MP3 audio.
     """
-    from src.voice_guardian import AlertSeverity, audio_to_base64
-    
     try:
-        voice = get_voice_guardian_instance()
+        severity = _VOICE_SEVERITY[request.severity]
+        audio = await pool.submit_alert(request.message, severity, request.address)
         
-        severity_map = {
-            "info": AlertSeverity.INFO,
-            "warning": AlertSeverity.WARNING,
-            "critical": AlertSeverity.CRITICAL,
-            "emergency": AlertSeverity.EMERGENCY,
-        }
-        
-        severity = severity_map.get(request.severity.lower(), AlertSeverity.INFO)
-        audio = await voice.speak_alert(request.message, severity, request.address)
-        
-        return {
+        return ORJSONResponse({
             "success": True,
             "audio_format": "mp3",
             "audio_data": audio_to_base64(audio),
             "message": request.message,
             "severity": request.severity,
-        }
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/v2/voice/speak/alert/stream")
+async def speak_alert_stream_endpoint(request: VoiceAlertRequest, voice=Depends(get_voice)):
+    """
+    Stream voice audio for an alert message.
+    
+    Returns MP3 audio (audio/mpeg) forwarded chunk by chunk from ElevenLabs'
+    streaming endpoint, so playback can start before synthesis finishes.
+    """
+    severity = _VOICE_SEVERITY[request.severity]
+    stream = voice.stream_alert(request.message, severity, request.address)
+    
+    # Pull the first chunk before committing to a 200, so upstream failures
+    # still surface as a proper HTTP error
+    try:
+        first_chunk = await stream.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    async def body():
+        if first_chunk:
+            yield first_chunk
+        async for chunk in stream:
+            yield chunk
+    
+    return StreamingResponse(body(), media_type="audio/mpeg")
 
 
 @app.post("/api/v2/voice/speak/inspection")
-async def speak_inspection_endpoint(request: VoiceInspectionRequest):
+async def speak_inspection_endpoint(
+    request: VoiceInspectionRequest,
+    http_request: Request,
+    voice=Depends(get_voice),
+):
     """
     Analyze a wallet for suspicious activity and speak the results.
     
     Returns base64-encoded MP3 audio of the spoken inspection report.
     """
-    from src.voice_guardian import audio_to_base64
-    from src.SusInspector import SusInspector
-    
     try:
-        # Run inspection
-        inspector = SusInspector()
-        result = inspector.inspect_wallet(request.address, request.lookback_days)
+        # Run inspection (blocking RPC) off the event loop
+        result = await asyncio.to_thread(
+            http_request.app.state.sus_inspector.inspect_wallet,
+            request.address,
+            request.lookback_days,
+        )
         
         # Generate voice
-        voice = get_voice_guardian_instance()
         audio = await voice.speak_suspicious_activity(result)
         
-        return {
+        return _voice_json_response({
             "success": True,
             "audio_format": "mp3",
-            "audio_data": audio_to_base64(audio),
             "inspection_result": result,
-        }
+        }, audio)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/v2/voice/speak/summary")
-async def speak_summary_endpoint(request: VoiceSummaryRequest):
+async def speak_summary_endpoint(
+    request: VoiceSummaryRequest,
+    http_request: Request,
+    voice=Depends(get_voice),
+):
     """
     Get wallet summary and speak it.
     
     Returns base64-encoded MP3 audio of the spoken wallet summary.
     """
-    from src.voice_guardian import audio_to_base64
-    from src.tools import GetWalletSummaryTool
-    
     try:
-        # Get summary
-        summary_tool = GetWalletSummaryTool()
-        summary = summary_tool.call(address=request.address)
+        # Get summary (blocking RPC) off the event loop
+        summary = await asyncio.to_thread(
+            http_request.app.state.summary_tool.call, request.address
+        )
         
         if isinstance(summary, dict) and summary.get("error"):
             raise HTTPException(status_code=400, detail=summary["error"])
         
         # Generate voice
-        voice = get_voice_guardian_instance()
         audio = await voice.speak_wallet_summary(
             summary,
             include_balances=request.include_balances,
             include_activity=request.include_activity,
         )
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "audio_format": "mp3",
             "audio_data": audio_to_base64(audio),
             "wallet_summary": summary,
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -929,55 +1152,47 @@ async def speak_summary_endpoint(request: VoiceSummaryRequest):
 
 
 @app.post("/api/v2/voice/speak/query")
-async def speak_query_endpoint(request: VoiceQueryRequest):
+async def speak_query_endpoint(request: VoiceQueryRequest, pool=Depends(get_voice_pool)):
     """
     Speak a response to a user query.
     
     Useful for making any text response audible.
     """
-    from src.voice_guardian import VoicePersona, audio_to_base64
-    
     try:
-        persona_map = {
-            "professional": VoicePersona.PROFESSIONAL,
-            "friendly": VoicePersona.FRIENDLY,
-            "urgent": VoicePersona.URGENT,
-            "concise": VoicePersona.CONCISE,
-        }
-        
-        persona = persona_map.get(request.persona.lower(), VoicePersona.PROFESSIONAL)
+        persona = _VOICE_PERSONA[request.persona]
         
-        voice = get_voice_guardian_instance()
-        audio = await voice.speak_query_response(request.query, request.response, persona)
+        audio = await pool.submit_query(request.response, persona)
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "audio_format": "mp3",
             "audio_data": audio_to_base64(audio),
             "persona": request.persona,
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/v2/voice/speak/portfolio")
-async def speak_portfolio_endpoint(request: PortfolioRequest):
+async def speak_portfolio_endpoint(
+    request: PortfolioRequest,
+    http_request: Request,
+    voice=Depends(get_voice),
+):
     """
     Analyze a portfolio and speak the briefing.
     
     Returns base64-encoded MP3 audio of the spoken portfolio analysis.
     """
-    from src.voice_guardian import audio_to_base64
-    from src.advanced_features import PortfolioAnalyzer, PortfolioWallet
-    
     try:
-        # Run portfolio analysis
-        analyzer = PortfolioAnalyzer()
+        # Run portfolio analysis (default label only formatted when missing)
         wallets = [
-            PortfolioWallet(address=w["address"], label=w.get("label", f"Wallet {i+1}"))
-            for i, w in enumerate(request.wallets)
+            PortfolioWallet(w["address"], w["label"] if "label" in w else f"Wallet {i}")
+            for i, w in enumerate(request.wallets, 1)
         ]
-        result = await analyzer.analyze_portfolio(wallets, request.lookback_days)
+        result = await http_request.app.state.portfolio_analyzer.analyze_portfolio(
+            wallets, request.lookback_days
+        )
         
         # Convert to dict for voice
         portfolio_dict = {
@@ -990,15 +1205,13 @@ async def speak_portfolio_endpoint(request: PortfolioRequest):
         }
         
         # Generate voice
-        voice = get_voice_guardian_instance()
         audio = await voice.speak_portfolio_briefing(portfolio_dict)
         
-        return {
+        return _voice_json_response({
             "success": True,
             "audio_format": "mp3",
-            "audio_data": audio_to_base64(audio),
             "portfolio_analysis": portfolio_dict,
-        }
+        }, audio)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1015,42 +1228,65 @@ class ContractScanRequest(BaseModel):
     use_ai: bool = True
 
 
-@app.get("/api/v2/contract-scan/{address}")
-async def scan_contract_for_malicious_patterns(
-    address: str,
-    chain: str = "sepolia",
-    format: str = "json",
-    force_refresh: bool = False,
-    use_ai: bool = True,
-):
+# Registered before /{address} so "known-malicious" isn't taken as an address
+@app.get("/api/v2/contract-scan/known-malicious")
+async def list_known_malicious_contracts(http_request: Request):
     """
-    Scan an Ethereum smart contract for malicious patterns.
+    List all known malicious contracts in the database.
     
-    This endpoint is designed to be called by the Neo Oracle to analyze
-    Ethereum contracts for security issues. Returns detailed explanations
-    of why a contract is flagged as malicious.
+    Useful for testing and reference.
+    """
+    # The database is static; the body is serialized once at startup
+    return Response(content=http_request.app.state.known_malicious_body, media_type="application/json")
+
+
+def _known_malicious_payload() -> dict:
+    """Build the known-malicious listing (called once in lifespan)."""
+    malicious = [
+        {
+            "address": addr,
+            "name": info.name,
+            "category": info.category.value,
+            "exploit_date": info.exploit_date,
+            "amount_stolen": info.amount_stolen,
+            "description": info.description[:200] + "..." if len(info.description) > 200 else info.description,
+        }
+        for addr, info in KNOWN_MALICIOUS_CONTRACTS.items()
+    ]
     
-    Args:
-        address: Ethereum contract address (0x...)
-        chain: Chain to scan - "sepolia" (default) or "ethereum" (mainnet)
-        format: Response format - "json" for full response, "oracle" for Neo Oracle compact format
-        force_refresh: Bypass cache and force fresh analysis
-        use_ai: Use AI for deep analysis (slower but more thorough)
+    trusted = [
+        {"address": addr, "name": name}
+        for addr, name in list(TRUSTED_CONTRACTS.items())[:20]
+    ]
     
-    Returns:
-        Full analysis with detected issues, risk score, and detailed explanations
+    return {
+        "known_malicious_count": len(malicious),
+        "known_malicious": malicious,
+        "trusted_sample_count": len(trusted),
+        "trusted_sample": trusted,
+    }
+
+
+async def _do_scan(
+    address: str,
+    chain: str,
+    format: str,
+    force_refresh: bool,
+    use_ai: bool,
+) -> Response:
+    """Run a contract scan and render it; shared by GET and POST."""
+    # Reject malformed addresses before any detector/RPC work, and lowercase
+    # once so differently-cased requests are the same scan
+    is_valid, error = is_valid_eth_address(address)
+    if not is_valid:
+        raise HTTPException(status_code=400, detail=error)
+    address = address.lower()
     
-    Example:
-        GET /api/v2/contract-scan/0xBB9bc244D798123fDe783fCc1C72d3Bb8C189413?chain=sepolia
-    """
     try:
-        from src.tools.malicious_contract_detector import (
-            MaliciousContractDetectorTool,
-            format_for_oracle,
-        )
-        
         detector = MaliciousContractDetectorTool()
-        result = detector.call(
+        # Blocking RPC + LLM work; keep it off the event loop
+        result = await asyncio.to_thread(
+            detector.call,
             contract_address=address,
             chain=chain,
             force_refresh=force_refresh,
@@ -1065,13 +1301,13 @@ async def scan_contract_for_malicious_patterns(
         if format.lower() == "oracle":
             # Compact format for Neo Oracle
             oracle_response = format_for_oracle(result)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "oracle_response": oracle_response,
                 "address": address,
             })
         else:
             # Full JSON response
-            return JSONResponse(content=result)
+            return ORJSONResponse(content=result)
             
     except HTTPException:
         raise
@@ -1079,59 +1315,51 @@ async def scan_contract_for_malicious_patterns(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/v2/contract-scan")
-async def scan_contract_post(request: ContractScanRequest):
+@app.get("/api/v2/contract-scan/{address}")
+async def scan_contract_for_malicious_patterns(
+    address: str,
+    chain: str = "sepolia",
+    format: str = "json",
+    force_refresh: bool = False,
+    use_ai: bool = True,
+):
     """
-    Scan an Ethereum smart contract for malicious patterns (POST version).
+    Scan an Ethereum smart contract for malicious patterns.
     
-    Same as GET but accepts parameters in request body.
+    This endpoint is designed to be called by the Neo Oracle to analyze
+    Ethereum contracts for security issues. Returns detailed explanations
+    of why a contract is flagged as malicious.
+    
+    Args:
+        address: Ethereum contract address (0x...)
+        chain: Chain to scan - "sepolia" (default) or "ethereum" (mainnet)
+        format: Response format - "json" for full response, "oracle" for Neo Oracle compact format
+        force_refresh: Bypass cache and force fresh analysis
+        use_ai: Use AI for deep analysis (slower but more thorough)
+    
+    Returns:
+        Full analysis with detected issues, risk score, and detailed explanations
+    
+    Example:
+        GET /api/v2/contract-scan/0xBB9bc244D798123fDe783fCc1C72d3Bb8C189413?chain=sepolia
     """
-    return await scan_contract_for_malicious_patterns(
-        address=request.contract_address,
-        chain=request.chain,
-        force_refresh=request.force_refresh,
-        use_ai=request.use_ai,
-    )
+    return await _do_scan(address, chain, format, force_refresh, use_ai)
 
 
-@app.get("/api/v2/contract-scan/known-malicious")
-async def list_known_malicious_contracts():
+@app.post("/api/v2/contract-scan")
+async def scan_contract_post(request: ContractScanRequest):
     """
-    List all known malicious contracts in the database.
+    Scan an Ethereum smart contract for malicious patterns (POST version).
     
-    Useful for testing and reference.
+    Same as GET but accepts parameters in request body.
     """
-    try:
-        from src.tools.known_malicious_contracts import (
-            KNOWN_MALICIOUS_CONTRACTS,
-            TRUSTED_CONTRACTS,
-        )
-        
-        malicious = [
-            {
-                "address": addr,
-                "name": info.name,
-                "category": info.category.value,
-                "exploit_date": info.exploit_date,
-                "amount_stolen": info.amount_stolen,
-                "description": info.description[:200] + "..." if len(info.description) > 200 else info.description,
-            }
-            for addr, info in KNOWN_MALICIOUS_CONTRACTS.items()
-        ]
-        
-        trusted = [
-            {"address": addr, "name": name}
-            for addr, name in list(TRUSTED_CONTRACTS.items())[:20]
-        ]
-        
-        return JSONResponse(content={
-            "known_malicious_count": len(malicious),
-            "known_malicious": malicious,
-            "trusted_sample_count": len(trusted),
-            "trusted_sample": trusted,
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _do_scan(
+        request.contract_address,
+        request.chain,
+        "json",
+        request.force_refresh,
+        request.use_ai,
+    )
 
 
 # =============================================================================
@@ -1159,7 +1387,7 @@ async def get_contract_info():
         config_path = os.path.join(os.path.dirname(__file__), "config.json")
         
         if not os.path.exists(config_path):
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "deployed": False,
                 "message": "Contract not yet deployed. Run: python contracts/deploy.py"
             })
@@ -1169,12 +1397,12 @@ async def get_contract_info():
         
         contract_hash = config.get("contract_hash")
         if not contract_hash:
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "deployed": False,
                 "message": "Contract hash not found in config"
             })
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "deployed": True,
             "contract_hash": contract_hash,
             "network": "neo3-testnet",
@@ -1198,7 +1426,7 @@ async def get_contract_info():
 
 
 @app.get("/api/v2/contract/score/{address}")
-async def get_onchain_risk_score(address: str):
+async def get_onchain_risk_score(address: str, neo: NeoClient = Depends(get_neo_client)):
     """
     Get the on-chain risk score for an address from the Neo N3 contract.
     
@@ -1221,16 +1449,11 @@ async def get_onchain_risk_score(address: str):
         if not contract_hash:
             raise HTTPException(status_code=400, detail="Contract hash not found")
         
-        # Query the contract using RPC
-        from src.neo_client import NeoClient
-        
-        neo = NeoClient()
-        
-        # Call get_risk_score method
-        result = neo.invoke_function(
-            contract_hash,
-            "get_risk_score",
-            [{"type": "String", "value": address}]
+        # Score and last update block are independent reads; overlap the RPCs
+        address_param = [{"type": "String", "value": address}]
+        result, update_result = await asyncio.gather(
+            neo.ainvoke_function(contract_hash, "get_risk_score", address_param),
+            neo.ainvoke_function(contract_hash, "get_last_update", address_param),
         )
         
         if result is None:
@@ -1238,13 +1461,6 @@ async def get_onchain_risk_score(address: str):
         
         score = int(result.get("stack", [{}])[0].get("value", -1))
         
-        # Get last update block
-        update_result = neo.invoke_function(
-            contract_hash,
-            "get_last_update",
-            [{"type": "String", "value": address}]
-        )
-        
         last_update = 0
         if update_result:
             last_update = int(update_result.get("stack", [{}])[0].get("value", 0))
@@ -1261,7 +1477,7 @@ async def get_onchain_risk_score(address: str):
         else:
             risk_level = "UNKNOWN"
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "address": address,
             "onchain_score": score,
             "risk_level": risk_level,
@@ -1301,7 +1517,7 @@ async def request_oracle_risk_score(address: str):
         if not contract_hash:
             raise HTTPException(status_code=400, detail="Contract hash not found")
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "info",
             "message": "Oracle requests must be submitted via a signed transaction",
             "contract_hash": contract_hash,
@@ -1330,8 +1546,20 @@ if __name__ == "__main__":
     
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
+    workers = int(os.getenv("WORKERS", "1"))
     
-    print(f"\nStarting server at http://{host}:{port}")
-    print(f"API docs at http://{host}:{port}/docs\n")
+    logger.info("Starting server at http://%s:%s (docs at /docs, workers=%d)", host, port, workers)
     
-    uvicorn.run(app, host=host, port=port)
+    # uvloop/httptools ship with uvicorn[standard] (uvloop not on Windows);
+    # per-request access logging is off, set ACCESS_LOG=true to re-enable
+    uvicorn.run(
+        # Multiple workers need an import string so each process builds its own app
+        "server:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        access_log=os.getenv("ACCESS_LOG", "").lower() == "true",
+        backlog=4096,
+    )
@@ -13,13 +13,18 @@ Usage:
 """
 
 import os
+import sys
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import Optional, AsyncGenerator
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 import logging
@@ -33,7 +38,12 @@ from spoon_ai.payments.app import create_paywalled_router
 from spoon_ai.payments import X402PaymentService
 
 # Import our agent
-from src.agent import build_agent, AGENT_NAME, get_tools, register_agent
+from src.agent import build_agent, AgentPool, AGENT_NAME, register_agent
+from src.cache import AnalysisCache
+from src.config import USE_MOCK
+from src.eth_client import is_valid_eth_address
+from src.tools.known_malicious_contracts import KNOWN_MALICIOUS_CONTRACTS
+from src.tools.malicious_contract_detector import MaliciousContractDetectorTool, format_for_oracle
 
 # =============================================================================
 # Agent Factory for SpoonOS
@@ -45,35 +55,98 @@ _agent_cache = {}
 # Accept both names for backwards compatibility
 ACCEPTED_AGENT_NAMES = {"wallet-guardian", "assertion-os", AGENT_NAME}
 
+# The tool set is fixed at import: build it once for discovery and the banner
+_AGENT_DESCRIPTOR = register_agent()
+_TOOL_NAMES = tuple(_AGENT_DESCRIPTOR["tools"])
+
 async def wallet_guardian_agent_factory(agent_name: str):
     """Factory function that returns our Wallet Guardian agent."""
     if agent_name not in ACCEPTED_AGENT_NAMES:
         raise ValueError(f"Unknown agent: {agent_name}. Available: {list(ACCEPTED_AGENT_NAMES)}")
     
-    # Use canonical name for caching
-    if AGENT_NAME not in _agent_cache:
-        _agent_cache[AGENT_NAME] = build_agent()
+    # Use canonical name for caching. build_agent() is synchronous, so the
+    # check-and-insert can't interleave with another coroutine (no lock needed)
+    agent = _agent_cache.get(AGENT_NAME)
+    if agent is None:
+        agent = _agent_cache[AGENT_NAME] = build_agent()
     
-    return _agent_cache[AGENT_NAME]
+    return agent
 
 
 # =============================================================================
 # App Configuration
 # =============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown events."""
+    # Build the agent before serving so the first paid request doesn't pay for it
+    app.state.agent = await wallet_guardian_agent_factory(AGENT_NAME)
+    # The free endpoints borrow from a pool so concurrent runs don't share
+    # one agent's step counter and memory
+    app.state.agent_pool = AgentPool()
+    await app.state.agent_pool.fill()
+    
+    # Tool list, descriptor and env don't change at runtime: serialize the
+    # discovery payloads once and serve the bytes as-is
+    app.state.health_body = orjson.dumps({
+        "status": "healthy",
+        "agent": AGENT_NAME,
+        "tools": list(_TOOL_NAMES),
+        "x402_enabled": bool(os.getenv("X402_RECEIVER_ADDRESS")),
+        "powered_by": "SpoonOS",
+    })
+    app.state.agents_body = orjson.dumps({"agents": [_AGENT_DESCRIPTOR]})
+    
+    # One detector for all scans (holds the Eth client and lazily built LLM)
+    app.state.detector = MaliciousContractDetectorTool()
+    # Scans are blocking (RPC + LLM) and slow; give them their own threads so
+    # a burst of AI scans can't exhaust the default executor other code uses
+    app.state.scan_pool = ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 2),
+        thread_name_prefix="contract-scan",
+    )
+    # Scan results by (address, chain, use_ai); oracle polling hits the same few
+    app.state.scan_cache = AnalysisCache(
+        max_entries=int(os.getenv("SCAN_CACHE_MAX_ENTRIES", "4096")),
+        ttl_seconds=float(os.getenv("SCAN_CACHE_TTL_SECONDS", "300")),
+    )
+    # KNOWN_MALICIOUS_CONTRACTS is static: serialize the listing once
+    app.state.known_malicious = KNOWN_MALICIOUS_CONTRACTS
+    app.state.known_malicious_body = orjson.dumps({
+        "count": len(KNOWN_MALICIOUS_CONTRACTS),
+        "contracts": [
+            {
+                "address": addr,
+                "name": info.name,
+                "category": info.category.value,
+            }
+            for addr, info in KNOWN_MALICIOUS_CONTRACTS.items()
+        ],
+    })
+    yield
+    
+    app.state.scan_pool.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="Neo Wallet Guardian (SpoonOS)",
     description="AI-powered wallet analysis agent for Neo N3 with SpoonOS x402 payment support",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# CORS middleware. ALLOWED_ORIGINS is a comma-separated list (default "*");
+# max_age lets browsers cache the preflight instead of sending one per call
+ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization", "x-payment"],
+    max_age=86400,
 )
 
 
@@ -82,29 +155,21 @@ app.add_middleware(
 # =============================================================================
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint with health check."""
-    return {
-        "status": "healthy",
-        "agent": AGENT_NAME,
-        "tools": [t.name for t in get_tools()],
-        "x402_enabled": bool(os.getenv("X402_RECEIVER_ADDRESS")),
-        "powered_by": "SpoonOS",
-    }
+    return Response(content=request.app.state.health_body, media_type="application/json")
 
 
 @app.get("/health")
-async def health():
+async def health(request: Request):
     """Health check endpoint."""
-    return await root()
+    return Response(content=request.app.state.health_body, media_type="application/json")
 
 
 @app.get("/agents")
-async def list_agents():
+async def list_agents(request: Request):
     """List available agents."""
-    return {
-        "agents": [register_agent()]
-    }
+    return Response(content=request.app.state.agents_body, media_type="application/json")
 
 
 # =============================================================================
@@ -140,22 +205,18 @@ app.include_router(x402_router, tags=["x402"])
 # =============================================================================
 
 @app.post("/analyze")
-async def analyze_wallet_free(prompt: str, use_mock: bool = False):
+async def analyze_wallet_free(request: Request, prompt: str, use_mock: bool = False):
     """
     Free endpoint for wallet analysis (no x402 required).
     Useful for testing and demos.
     """
-    if use_mock:
-        os.environ["WALLET_GUARDIAN_USE_MOCK"] = "true"
+    # Scoped to this request's context (tools read it via use_mock_enabled());
+    # mutating os.environ would leak the flag into concurrent requests
+    mock_token = USE_MOCK.set(use_mock)
     
     try:
-        agent = await wallet_guardian_agent_factory(AGENT_NAME)
-        result = await agent.run(prompt)
-        
-        # Reset agent state
-        agent.current_step = 0
-        if hasattr(agent, 'memory') and hasattr(agent.memory, 'clear'):
-            agent.memory.clear()
+        async with request.app.state.agent_pool.acquire() as agent:
+            result = await agent.run(prompt)
         
         return {
             "agent": AGENT_NAME,
@@ -163,117 +224,105 @@ async def analyze_wallet_free(prompt: str, use_mock: bool = False):
             "response": result,
         }
     finally:
-        if "WALLET_GUARDIAN_USE_MOCK" in os.environ:
-            del os.environ["WALLET_GUARDIAN_USE_MOCK"]
+        USE_MOCK.reset(mock_token)
+
 
+# Words per SSE frame when streaming a finished result
+STREAM_CHUNK_WORDS = 64
 
-async def stream_agent_response(prompt: str) -> AsyncGenerator[str, None]:
+
+async def stream_agent_response(
+    request: Request, prompt: str, use_mock: bool = False
+) -> AsyncGenerator[str, None]:
     """
     Stream the agent response with progress updates.
     Yields Server-Sent Events (SSE) formatted data.
     
     Note: Since the underlying SDK doesn't support true token streaming,
     we run the agent to completion while sending keepalive/progress messages,
-    then stream the result word by word for a better user experience.
+    then stream the result in word chunks so the client renders progressively.
+    The agent is cancelled if the client goes away before it finishes.
     """
-    try:
-        agent = await wallet_guardian_agent_factory(AGENT_NAME)
+    pool: AgentPool = request.app.state.agent_pool
+    # Frames from the producer; an exception is re-raised, None ends the stream
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def run_agent():
+        # Runs in its own task (its own context copy), so no reset needed
+        USE_MOCK.set(use_mock)
+        try:
+            async with pool.acquire() as agent:
+                result = await agent.run(prompt)
+        except Exception as e:
+            queue.put_nowait(e)
+            return
         
+        # Clear the progress messages and stream the actual result
+        queue.put_nowait("[CLEAR]")
+        # The result is already complete: send it in word chunks, no delays.
+        # Later chunks lead with the joining space (SSE strips only one)
+        if result:
+            words = result.split(' ')
+            for i in range(0, len(words), STREAM_CHUNK_WORDS):
+                sep = " " if i else ""
+                queue.put_nowait(f"{sep}{' '.join(words[i:i + STREAM_CHUNK_WORDS])}")
+        queue.put_nowait("[DONE]")
+        queue.put_nowait(None)
+    
+    agent_task = asyncio.create_task(run_agent())
+    
+    # Sent when 5 seconds pass without a frame, to keep the connection alive
+    progress_messages = [
+        "Fetching blockchain data...",
+        "Analyzing transactions...",
+        "Computing risk score...",
+        "Generating report...",
+    ]
+    msg_index = 0
+    
+    try:
         # Send initial status
         yield "data: Analyzing wallet...\n\n"
         
-        # Run agent in background task so we can send keepalives
-        result_holder = {"result": None, "error": None, "done": False}
-        
-        async def run_agent():
+        while not await request.is_disconnected():
             try:
-                result_holder["result"] = await agent.run(prompt)
-            except Exception as e:
-                result_holder["error"] = e
-            finally:
-                result_holder["done"] = True
-        
-        # Start the agent task
-        agent_task = asyncio.create_task(run_agent())
-        
-        # Send keepalive pings every 5 seconds while waiting
-        progress_messages = [
-            "Fetching blockchain data...",
-            "Analyzing transactions...",
-            "Computing risk score...",
-            "Generating report...",
-        ]
-        msg_index = 0
-        
-        while not result_holder["done"]:
-            await asyncio.sleep(5)
-            if not result_holder["done"]:
-                # Send progress update to keep connection alive
-                msg = progress_messages[msg_index % len(progress_messages)]
-                yield f"data: {msg}\n\n"
+                frame = await asyncio.wait_for(queue.get(), timeout=5)
+            except asyncio.TimeoutError:
+                yield f"data: {progress_messages[msg_index % len(progress_messages)]}\n\n"
                 msg_index += 1
-        
-        # Wait for task to fully complete
-        await agent_task
-        
-        # Check for errors
-        if result_holder["error"]:
-            raise result_holder["error"]
-        
-        result = result_holder["result"]
-        
-        # Reset agent state
-        agent.current_step = 0
-        if hasattr(agent, 'memory') and hasattr(agent.memory, 'clear'):
-            agent.memory.clear()
-        
-        # Clear the progress messages and stream the actual result
-        yield "data: [CLEAR]\n\n"
-        await asyncio.sleep(0.02)
-        
-        # Stream the result word by word for a typing effect
-        if result:
-            words = result.split(' ')
-            for i, word in enumerate(words):
-                # Add space before word (except first)
-                if i > 0:
-                    yield f"data:  \n\n"
-                yield f"data: {word}\n\n"
-                # Small delay between words for typing effect
-                await asyncio.sleep(0.01)
-        
-        # Send done event
-        yield "data: [DONE]\n\n"
+                continue
+            if frame is None:
+                break
+            if isinstance(frame, Exception):
+                raise frame
+            yield f"data: {frame}\n\n"
         
     except Exception as e:
-        logger.error(f"Streaming error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Streaming error")
         yield f"data: [ERROR] {str(e)}\n\n"
+    finally:
+        # No-op once the agent is done; otherwise the client left (or the
+        # server cancelled the response) and the run is wasted work
+        agent_task.cancel()
 
 
 @app.post("/analyze/stream")
-async def analyze_wallet_stream(prompt: str, use_mock: bool = False):
+async def analyze_wallet_stream(request: Request, prompt: str, use_mock: bool = False):
     """
     Streaming endpoint for wallet analysis.
     Returns Server-Sent Events (SSE) stream of tokens.
     """
-    if use_mock:
-        os.environ["WALLET_GUARDIAN_USE_MOCK"] = "true"
-    
-    try:
-        return StreamingResponse(
-            stream_agent_response(prompt),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",  # Disable nginx buffering
-            }
-        )
-    finally:
-        if "WALLET_GUARDIAN_USE_MOCK" in os.environ:
-            del os.environ["WALLET_GUARDIAN_USE_MOCK"]
+    # use_mock travels with the stream: the agent runs after this handler
+    # returns, so a flag set here (let alone in os.environ) wouldn't apply
+    return StreamingResponse(
+        stream_agent_response(request, prompt, use_mock),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
 
 
 # =============================================================================
@@ -288,8 +337,81 @@ class ContractScanRequest(BaseModel):
     use_ai: bool = True
 
 
+async def _do_scan(
+    state,
+    address: str,
+    chain: str,
+    format: str,
+    force_refresh: bool,
+    use_ai: bool,
+) -> Response:
+    """Run (or reuse) a contract scan and render it; shared by GET and POST."""
+    # Reject malformed addresses before any detector/RPC work, and lowercase
+    # once so differently-cased requests are the same scan
+    is_valid, error = is_valid_eth_address(address)
+    if not is_valid:
+        raise HTTPException(status_code=400, detail=error)
+    address = address.lower()
+    
+    try:
+        detector = state.detector
+        cache = state.scan_cache
+        key = (address, chain, use_ai)
+        
+        async def scan():
+            return await asyncio.get_running_loop().run_in_executor(
+                state.scan_pool,
+                functools.partial(
+                    detector.call,
+                    contract_address=address,
+                    chain=chain,
+                    force_refresh=force_refresh,
+                    use_ai=use_ai,
+                ),
+            )
+        
+        # Both response formats share one cached scan; formatting happens after.
+        # A forced refresh must not join a non-forced scan already in flight,
+        # so it scans directly and replaces the cached result
+        if force_refresh:
+            result = await scan()
+            computed = True
+            if "error" not in result:
+                cache.put(key, result)
+        else:
+            result, computed = await cache.fetch(key, scan)
+        # MISS only when this request did the scan; joining one in flight is a HIT
+        headers = {"X-Cache": "MISS" if computed else "HIT"}
+        
+        if "error" in result:
+            cache.discard(key)
+            raise HTTPException(status_code=400, detail=result["error"])
+        
+        if format.lower() == "oracle":
+            oracle_response = format_for_oracle(result)
+            return ORJSONResponse(content={
+                "oracle_response": oracle_response,
+                "address": address,
+            }, headers=headers)
+        else:
+            return ORJSONResponse(content=result, headers=headers)
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Registered before /{address} so "known-malicious" isn't taken as an address
+@app.get("/api/v2/contract-scan/known-malicious")
+async def list_known_malicious_contracts(request: Request):
+    """List all known malicious contracts in the database."""
+    return Response(content=request.app.state.known_malicious_body, media_type="application/json")
+
+
 @app.get("/api/v2/contract-scan/{address}")
 async def scan_contract_for_malicious_patterns(
+    request: Request,
     address: str,
     chain: str = "ethereum",
     format: str = "json",
@@ -309,69 +431,22 @@ async def scan_contract_for_malicious_patterns(
         force_refresh: Bypass cache and force fresh analysis
         use_ai: Use AI for deep analysis (slower but more thorough)
     """
-    try:
-        from src.tools.malicious_contract_detector import (
-            MaliciousContractDetectorTool,
-            format_for_oracle,
-        )
-        
-        detector = MaliciousContractDetectorTool()
-        result = detector.call(
-            contract_address=address,
-            chain=chain,
-            force_refresh=force_refresh,
-            use_ai=use_ai,
-        )
-        
-        if "error" in result:
-            raise HTTPException(status_code=400, detail=result["error"])
-        
-        if format.lower() == "oracle":
-            oracle_response = format_for_oracle(result)
-            return JSONResponse(content={
-                "oracle_response": oracle_response,
-                "address": address,
-            })
-        else:
-            return JSONResponse(content=result)
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _do_scan(request.app.state, address, chain, format, force_refresh, use_ai)
 
 
 @app.post("/api/v2/contract-scan")
-async def scan_contract_post(request: ContractScanRequest):
+async def scan_contract_post(request: ContractScanRequest, http_request: Request):
     """POST version of contract scan."""
-    return await scan_contract_for_malicious_patterns(
-        address=request.contract_address,
-        chain=request.chain,
-        force_refresh=request.force_refresh,
-        use_ai=request.use_ai,
+    return await _do_scan(
+        http_request.app.state,
+        request.contract_address,
+        request.chain,
+        "json",
+        request.force_refresh,
+        request.use_ai,
     )
 
 
-@app.get("/api/v2/contract-scan/known-malicious")
-async def list_known_malicious_contracts():
-    """List all known malicious contracts in the database."""
-    try:
-        from src.tools.known_malicious_contracts import KNOWN_MALICIOUS_CONTRACTS
-        return JSONResponse(content={
-            "count": len(KNOWN_MALICIOUS_CONTRACTS),
-            "contracts": [
-                {
-                    "address": addr,
-                    "name": info.get("name"),
-                    "category": info.get("category"),
-                }
-                for addr, info in KNOWN_MALICIOUS_CONTRACTS.items()
-            ]
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
 # =============================================================================
 # Main
 # =============================================================================
@@ -381,6 +456,7 @@ if __name__ == "__main__":
     
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
+    workers = int(os.getenv("WORKERS", "1"))
     
     print(f"\n{'='*60}")
     print(f"  Neo Wallet Guardian - SpoonOS x402 Gateway")
@@ -388,7 +464,21 @@ if __name__ == "__main__":
     print(f"  Server: http://{host}:{port}")
     print(f"  API Docs: http://{host}:{port}/docs")
     print(f"  Agent: {AGENT_NAME}")
-    print(f"  Tools: {[t.name for t in get_tools()]}")
+    print(f"  Tools: {list(_TOOL_NAMES)}")
+    print(f"  Workers: {workers}")
     print(f"{'='*60}\n")
     
-    uvicorn.run(app, host=host, port=port)
+    # Same runtime settings as server.py: uvloop/httptools from uvicorn[standard]
+    # (uvloop not on Windows), access log off unless ACCESS_LOG=true. Each
+    # worker builds its own agent pool, detector and caches in the lifespan
+    uvicorn.run(
+        # Multiple workers need an import string so each process builds its own app
+        "spoonos_server:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        access_log=os.getenv("ACCESS_LOG", "").lower() == "true",
+        backlog=4096,
+    )
@@ -90,6 +90,15 @@ class SusInspector:
         "setTaxTo100", "blacklistAll", "disableTransfer"
     }
     
+    # Both lists folded into one case-insensitive alternation each, so a
+    # name is checked with a single regex scan instead of a loop per pattern
+    _SUSPICIOUS_NAME_RE = re.compile(
+        "|".join(p.removeprefix("(?i)") for p in SUSPICIOUS_NAME_PATTERNS), re.I
+    )
+    _SUSPICIOUS_METHOD_RE = re.compile(
+        "|".join(re.escape(m) for m in sorted(SUSPICIOUS_METHODS)), re.I
+    )
+    
     # Cache for contract analysis
     _contract_cache: Dict[str, ContractAnalysis] = {}
 
@@ -297,12 +306,9 @@ class SusInspector:
                 update_counter = contract_state.get("updatecounter", 0)
                 
                 # Check contract name for suspicious patterns
-                if name:
-                    for pattern in self.SUSPICIOUS_NAME_PATTERNS:
-                        if re.search(pattern, name):
-                            reasons.append(f"Suspicious name pattern: '{name}'")
-                            risk_level = max(risk_level, SuspicionLevel.MEDIUM, key=lambda x: x.value)
-                            break
+                if name and self._SUSPICIOUS_NAME_RE.search(name):
+                    reasons.append(f"Suspicious name pattern: '{name}'")
+                    risk_level = max(risk_level, SuspicionLevel.MEDIUM, key=lambda x: x.value)
                 
                 # Check update counter (frequently updated contracts may be suspicious)
                 if update_counter > 10:
@@ -394,10 +400,8 @@ class SusInspector:
             method_name = method.get("name", "").lower()
             
             # Check against known suspicious method names
-            for sus_method in self.SUSPICIOUS_METHODS:
-                if sus_method.lower() in method_name:
-                    reasons.append(f"Suspicious method name: '{method.get('name')}'")
-                    break
+            if self._SUSPICIOUS_METHOD_RE.search(method_name):
+                reasons.append(f"Suspicious method name: '{method.get('name')}'")
             
             # Check for hidden/obfuscated method names
             if len(method_name) == 1 or method_name.startswith("_"):
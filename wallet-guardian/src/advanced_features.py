@@ -11,15 +11,19 @@ Game-changing features that utilize the DAG-based computation system:
 
 from __future__ import annotations
 
+import ast
 import asyncio
 import hashlib
-import json
+import logging
+import os
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, AsyncIterator
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, AsyncIterator
+
+import orjson
 
 from .graph_orchestrator import (
     WalletDataCache,
@@ -37,6 +41,8 @@ from .graph_orchestrator import (
 )
 from .neo_client import NeoClient
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # FEATURE 1: REAL-TIME WALLET MONITORING (WebSocket-ready)
@@ -72,7 +78,11 @@ class WalletEvent:
         }
     
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), default=str)
+        return orjson.dumps(self.to_dict(), default=str).decode()
+
+
+# Wallets polled per monitoring round-trip sweep
+MONITOR_POLL_CHUNK = 50
 
 
 class RealTimeMonitor:
@@ -96,6 +106,10 @@ class RealTimeMonitor:
         self.cache = WalletDataCache()
         self._running = False
         self._listeners: List[Callable[[WalletEvent], None]] = []
+        # Incremental polling: chain tip each wallet was last checked at, and a
+        # digest of the last fetched snapshot so identical refetches are skipped
+        self._last_tip_per_wallet: Dict[str, int] = {}
+        self._last_state_hash: Dict[str, str] = {}
     
     def add_wallet(self, address: str, config: Optional[Dict[str, Any]] = None):
         """Add a wallet to monitor."""
@@ -111,6 +125,8 @@ class RealTimeMonitor:
     def remove_wallet(self, address: str):
         """Remove a wallet from monitoring."""
         self.monitored_wallets.pop(address, None)
+        self._last_tip_per_wallet.pop(address, None)
+        self._last_state_hash.pop(address, None)
     
     def add_listener(self, callback: Callable[[WalletEvent], None]):
         """Add an event listener (for WebSocket pushing)."""
@@ -121,10 +137,10 @@ class RealTimeMonitor:
         for listener in self._listeners:
             try:
                 listener(event)
-            except Exception as e:
-                print(f"Listener error: {e}")
+            except Exception:
+                logger.exception("Monitor listener failed")
     
-    async def _check_wallet(self, address: str) -> List[WalletEvent]:
+    async def _check_wallet(self, address: str, tip: Optional[int] = None) -> List[WalletEvent]:
         """Check a single wallet for changes."""
         events: List[WalletEvent] = []
         state = self.monitored_wallets[address]
@@ -136,6 +152,18 @@ class RealTimeMonitor:
             balances = data["balances"]
             transfers = data["transfers"]
             
+            if tip is not None:
+                self._last_tip_per_wallet[address] = tip
+            
+            # Same snapshot as last tick: nothing can have changed, skip the diff
+            digest = hashlib.blake2b(
+                orjson.dumps([balances, transfers], option=orjson.OPT_SORT_KEYS),
+                digest_size=16,
+            ).hexdigest()
+            if self._last_state_hash.get(address) == digest:
+                return events
+            self._last_state_hash[address] = digest
+            
             # Check balance changes
             if state["last_balances"] is not None:
                 old_total = sum(float(b.get("amount", 0)) for b in state["last_balances"])
@@ -276,13 +304,31 @@ class RealTimeMonitor:
         """Run one monitoring cycle across all wallets."""
         all_events: List[WalletEvent] = []
         
-        # Check all wallets in parallel using the graph orchestrator's caching
-        tasks = [self._check_wallet(addr) for addr in self.monitored_wallets]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One cheap getblockcount per tick: a wallet already checked at this
+        # tip can't have new on-chain activity, so it is skipped entirely
+        try:
+            tip: Optional[int] = await self.fetcher.neo_client.aget_block_count()
+        except Exception:
+            tip = None
+        addresses = [
+            addr for addr in self.monitored_wallets
+            if tip is None or self._last_tip_per_wallet.get(addr) != tip
+        ]
         
-        for result in results:
-            if isinstance(result, list):
-                all_events.extend(result)
+        for i in range(0, len(addresses), MONITOR_POLL_CHUNK):
+            chunk = addresses[i:i + MONITOR_POLL_CHUNK]
+            
+            # Warm the shared cache with one bounded transfer sweep for the chunk,
+            # so the per-wallet checks below only fetch balances
+            await self.fetcher.get_many_transfers(chunk, lookback_days=7)
+            
+            results = await asyncio.gather(
+                *(self._check_wallet(addr, tip) for addr in chunk),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, list):
+                    all_events.extend(result)
         
         # Emit events
         for event in all_events:
@@ -316,7 +362,12 @@ class RealTimeMonitor:
 # FEATURE 2: MULTI-WALLET PORTFOLIO ANALYSIS
 # =============================================================================
 
-@dataclass
+# Max wallets analyzed at once per portfolio (bounds outbound Neo RPC load)
+PORTFOLIO_CONCURRENCY = int(os.getenv("PORTFOLIO_CONCURRENCY", "8"))
+# Seconds a per-wallet analysis is reused across portfolio requests
+PORTFOLIO_CACHE_TTL = int(os.getenv("PORTFOLIO_CACHE_TTL", "60"))
+
+@dataclass(slots=True, frozen=True)
 class PortfolioWallet:
     """A wallet in the portfolio."""
     address: str
@@ -352,6 +403,28 @@ class PortfolioAnalyzer:
         self.fetcher = UnifiedDataFetcher()
         self.cache = WalletDataCache()
     
+    async def _analyze_one(
+        self,
+        address: str,
+        lookback_days: int,
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        """Analyze one wallet, reusing a recent result for the same lookback."""
+        cached = self.cache.get(
+            "portfolio_analysis", ttl=PORTFOLIO_CACHE_TTL,
+            address=address, lookback_days=lookback_days,
+        )
+        if cached is not None:
+            return cached
+        
+        async with semaphore:
+            result = await analyze_wallet(address, lookback_days)
+        self.cache.set(
+            "portfolio_analysis", result,
+            address=address, lookback_days=lookback_days,
+        )
+        return result
+    
     async def analyze_portfolio(
         self,
         wallets: List[PortfolioWallet],
@@ -367,8 +440,9 @@ class PortfolioAnalyzer:
         """
         start_time = time.time()
         
-        # Parallel analysis of all wallets
-        tasks = [analyze_wallet(w.address, lookback_days) for w in wallets]
+        # Parallel analysis of all wallets, at most PORTFOLIO_CONCURRENCY in flight
+        semaphore = asyncio.Semaphore(PORTFOLIO_CONCURRENCY)
+        tasks = [self._analyze_one(w.address, lookback_days, semaphore) for w in wallets]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         individual_analyses: Dict[str, Dict[str, Any]] = {}
@@ -580,48 +654,46 @@ class PredictiveRiskAnalyzer:
         now = time.time()
         week_seconds = 7 * 24 * 60 * 60
         
-        # Simulate weekly snapshots by filtering transactions
         transfers = data.get("transfers", {})
-        all_txs = transfers.get("sent", []) + transfers.get("received", [])
+        balances = data.get("balances", [])
+        num_weeks = lookback_days // 7
+        
+        # Bucket every transaction into its week in a single pass, keeping its
+        # direction, instead of rescanning all transactions for every week
+        buckets: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+        for direction in ("sent", "received"):
+            for tx in transfers.get(direction, []):
+                age = now - tx.get("timestamp", 0)
+                if age < 0:
+                    continue
+                week = int(age // week_seconds)
+                if week >= num_weeks:
+                    continue
+                bucket = buckets.get(week)
+                if bucket is None:
+                    bucket = buckets[week] = {"sent": [], "received": []}
+                bucket[direction].append(tx)
+        
+        # Balance metrics don't vary per week (simplified - ideally would reconstruct)
+        concentration = compute_concentration(balances)
+        stablecoin = compute_stablecoin_ratio(balances)
         
-        for week in range(lookback_days // 7):
+        # Simulate weekly snapshots from the bucketed transactions
+        for week, week_transfers in buckets.items():
             week_end = now - (week * week_seconds)
-            week_start = week_end - week_seconds
-            
-            # Filter transactions for this week
-            week_txs = [
-                tx for tx in all_txs
-                if week_start <= tx.get("timestamp", 0) <= week_end
-            ]
+            counterparties = extract_counterparties(week_transfers)
+            patterns = detect_suspicious_patterns(week_transfers)
             
-            # Calculate metrics for this period
-            if week_txs:
-                week_transfers = {"sent": [], "received": []}
-                for tx in week_txs:
-                    if tx in transfers.get("sent", []):
-                        week_transfers["sent"].append(tx)
-                    else:
-                        week_transfers["received"].append(tx)
-                
-                counterparties = extract_counterparties(week_transfers)
-                patterns = detect_suspicious_patterns(week_transfers)
-                
-                # Use current balances (simplified - ideally would reconstruct)
-                concentration = compute_concentration(data.get("balances", []))
-                stablecoin = compute_stablecoin_ratio(data.get("balances", []))
-                
-                score, _ = compute_risk_score(
-                    concentration, stablecoin, len(counterparties), patterns
-                )
-                scores.append((week_end, score))
+            score, _ = compute_risk_score(
+                concentration, stablecoin, len(counterparties), patterns
+            )
+            scores.append((week_end, score))
         
         # Add current score
-        current_concentration = compute_concentration(data.get("balances", []))
-        current_stablecoin = compute_stablecoin_ratio(data.get("balances", []))
         current_counterparties = extract_counterparties(transfers)
         current_patterns = detect_suspicious_patterns(transfers)
         current_score, _ = compute_risk_score(
-            current_concentration, current_stablecoin,
+            concentration, stablecoin,
             len(current_counterparties), current_patterns
         )
         scores.append((now, current_score))
@@ -751,7 +823,7 @@ class PredictiveRiskAnalyzer:
 # FEATURE 4: WALLET RELATIONSHIP GRAPH (Network Analysis)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class WalletNode:
     """A node in the relationship graph."""
     address: str
@@ -762,7 +834,7 @@ class WalletNode:
     node_type: str = "unknown"  # "wallet", "contract", "exchange", "dex"
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletEdge:
     """An edge (relationship) between wallets."""
     from_address: str
@@ -1111,17 +1183,69 @@ class Alert:
     acknowledged: bool = False
 
 
+# Max alerts retained in memory; oldest are evicted first
+ALERT_CAP = int(os.getenv("ALERT_CAP", "100000"))
+
+# Variables and syntax a custom alert condition may use
+RULE_VARIABLES = frozenset({
+    "risk_score", "balance", "balance_change_percent",
+    "counterparty_count", "concentration", "stablecoin_ratio",
+})
+_RULE_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.UAdd,
+    ast.Compare, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
+    ast.Name, ast.Load, ast.Constant,
+)
+
+
+def compile_rule_condition(condition_expr: str) -> Tuple[Any, Tuple[str, ...]]:
+    """
+    Validate and compile a custom alert expression once.
+    
+    Returns the code object and the variable names it reads. Raises
+    ValueError for syntax errors, unknown variables or disallowed constructs.
+    """
+    try:
+        tree = ast.parse(condition_expr, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid condition syntax: {e.msg}") from None
+    
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _RULE_NODES):
+            raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+        if isinstance(node, ast.Name):
+            if node.id not in RULE_VARIABLES:
+                raise ValueError(f"Unknown variable: {node.id}")
+            names.add(node.id)
+        elif isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float))
+        ):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+    
+    return compile(tree, "<alert-rule>", "eval"), tuple(names)
+
+
 class SmartAlertSystem:
     """
     Configurable alert system with customizable rules.
     
     Integrates with the graph orchestrator to efficiently
     evaluate alerts across multiple wallets.
+    
+    Alert history is a bounded ring buffer (ALERT_CAP) with id, wallet,
+    priority and unacknowledged indices, so queries touch only the
+    matching alerts instead of scanning the whole history.
     """
     
-    def __init__(self):
+    def __init__(self, alert_cap: int = ALERT_CAP):
         self.rules: Dict[str, AlertRule] = {}
-        self.alerts: List[Alert] = []
+        self.alerts: Deque[Alert] = deque(maxlen=alert_cap)
+        self._alerts_by_id: Dict[str, Alert] = {}
+        self._ids_by_wallet: Dict[str, Set[str]] = defaultdict(set)
+        self._ids_by_priority: Dict[AlertPriority, Set[str]] = defaultdict(set)
+        self._unacknowledged_ids: Set[str] = set()
         self.last_triggered: Dict[str, float] = {}  # rule_id:address -> timestamp
         self.fetcher = UnifiedDataFetcher()
         self._setup_default_rules()
@@ -1198,19 +1322,18 @@ class SmartAlertSystem:
         
         Supported variables: risk_score, balance, balance_change_percent,
         counterparty_count, concentration, stablecoin_ratio
+        
+        The expression is parsed and compiled here, once; raises ValueError
+        if it is not a valid condition.
         """
+        code, names = compile_rule_condition(condition_expr)
         rule_id = hashlib.md5(f"{name}{time.time()}".encode()).hexdigest()[:8]
+        no_builtins = {"__builtins__": {}}
         
         def condition(data: Dict[str, Any]) -> bool:
-            # Safe evaluation of simple expressions
             try:
-                # Replace variable names with dict access
-                expr = condition_expr
-                for var in ["risk_score", "balance", "balance_change_percent",
-                           "counterparty_count", "concentration", "stablecoin_ratio"]:
-                    expr = expr.replace(var, f"data.get('{var}', 0)")
-                return eval(expr)
-            except:
+                return bool(eval(code, no_builtins, {n: data.get(n, 0) for n in names}))
+            except Exception:
                 return False
         
         rule = AlertRule(
@@ -1294,9 +1417,32 @@ class SmartAlertSystem:
             except Exception as e:
                 pass  # Skip rule on error
         
-        self.alerts.extend(triggered)
+        for alert in triggered:
+            self._store_alert(alert)
         return triggered
     
+    def _store_alert(self, alert: Alert):
+        """Append an alert to the ring buffer, evicting the oldest when full."""
+        if len(self.alerts) == self.alerts.maxlen:
+            self._unindex_alert(self.alerts[0])
+        self.alerts.append(alert)
+        self._alerts_by_id[alert.id] = alert
+        self._ids_by_wallet[alert.wallet_address].add(alert.id)
+        self._ids_by_priority[alert.priority].add(alert.id)
+        if not alert.acknowledged:
+            self._unacknowledged_ids.add(alert.id)
+    
+    def _unindex_alert(self, alert: Alert):
+        """Drop an evicted alert from every index."""
+        self._alerts_by_id.pop(alert.id, None)
+        wallet_ids = self._ids_by_wallet.get(alert.wallet_address)
+        if wallet_ids is not None:
+            wallet_ids.discard(alert.id)
+            if not wallet_ids:
+                del self._ids_by_wallet[alert.wallet_address]
+        self._ids_by_priority[alert.priority].discard(alert.id)
+        self._unacknowledged_ids.discard(alert.id)
+    
     def _generate_description(self, rule: AlertRule, data: Dict) -> str:
         """Generate human-readable alert description."""
         if rule.alert_type == AlertType.BALANCE_DROP:
@@ -1318,23 +1464,33 @@ class SmartAlertSystem:
         unacknowledged_only: bool = False
     ) -> List[Alert]:
         """Get alerts with optional filters."""
-        result = self.alerts
-        
+        # Narrow via the indices first, smallest candidate set leading
+        candidates: List[Set[str]] = []
         if wallet:
-            result = [a for a in result if a.wallet_address == wallet]
+            candidates.append(self._ids_by_wallet.get(wallet, set()))
         if priority:
-            result = [a for a in result if a.priority.value >= priority.value]
+            candidates.append(set().union(*(
+                ids for p, ids in self._ids_by_priority.items()
+                if p.value >= priority.value
+            )))
         if unacknowledged_only:
-            result = [a for a in result if not a.acknowledged]
+            candidates.append(self._unacknowledged_ids)
+        
+        if candidates:
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+            result = [self._alerts_by_id[i] for i in ids]
+        else:
+            result = list(self._alerts_by_id.values())
         
         return sorted(result, key=lambda a: (a.priority.value, a.triggered_at), reverse=True)
     
     def acknowledge_alert(self, alert_id: str):
         """Mark an alert as acknowledged."""
-        for alert in self.alerts:
-            if alert.id == alert_id:
-                alert.acknowledged = True
-                break
+        alert = self._alerts_by_id.get(alert_id)
+        if alert is not None:
+            alert.acknowledged = True
+            self._unacknowledged_ids.discard(alert_id)
 
 
 # =============================================================================
@@ -13,7 +13,9 @@ Or the full orchestrator:
 
 import os
 import asyncio
-from typing import List, Optional
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional
 
 from spoon_ai.agents import ToolCallAgent, SpoonReactAI
 from spoon_ai.chat import ChatBot, Memory
@@ -32,9 +34,14 @@ from .tools import (
 from .graph_orchestrator import MultiAgentOrchestrator, analyze_wallet as graph_analyze
 
 
+logger = logging.getLogger(__name__)
+
 # Agent name constant
 AGENT_NAME = "wallet-guardian"
 
+# Idle agents kept by AgentPool (each holds its own step counter and memory)
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", "4"))
+
 # System prompt for the unified agent - comprehensive and structured
 WALLET_SYSTEM_PROMPT = """You are Assertion OS, an AI agent for blockchain risk analysis on Neo N3.
 
@@ -73,18 +80,36 @@ Guidelines:
 Available tools will help you analyze Neo N3 wallets comprehensively."""
 
 
+_TOOL_CLASSES = (
+    GetWalletSummaryTool,
+    WalletValidityScoreTool,
+    FlagCounterpartyRiskTool,
+    ScheduleMonitorTool,
+    MultiWalletDiffTool,
+    ApprovalScanTool,
+    ActionDraftTool,
+    MaliciousContractDetectorTool,
+)
+
+
+def _instantiate_tools() -> tuple:
+    """Instantiate each tool once; a tool that fails to construct is skipped."""
+    tools = []
+    for tool_cls in _TOOL_CLASSES:
+        try:
+            tools.append(tool_cls())
+        except Exception as e:
+            logger.warning("Skipping tool %s: %s", tool_cls.__name__, e)
+    return tuple(tools)
+
+
+# Tool instances are stateless between calls, so every agent shares the same ones.
+_TOOLS = _instantiate_tools()
+
+
 def _create_tools_list() -> List[BaseTool]:
-    """Create the standard tools list. Used by all agent builders."""
-    return [
-        GetWalletSummaryTool(),
-        WalletValidityScoreTool(),
-        FlagCounterpartyRiskTool(),
-        ScheduleMonitorTool(),
-        MultiWalletDiffTool(),
-        ApprovalScanTool(),
-        ActionDraftTool(),
-        MaliciousContractDetectorTool(),
-    ]
+    """Return the standard tools list. Used by all agent builders."""
+    return list(_TOOLS)
 
 
 def _get_llm() -> ChatBot:
@@ -160,6 +185,42 @@ def build_react_agent() -> SpoonReactAI:
     return agent
 
 
+class AgentPool:
+    """
+    Fixed set of prebuilt agents handed out one request at a time.
+    
+    A ToolCallAgent keeps per-run state (current_step, memory), so a single
+    shared instance serializes concurrent runs or mixes their conversations.
+    Callers wait for an idle agent instead; it is reset before going back.
+    """
+    
+    def __init__(
+        self,
+        size: int = AGENT_POOL_SIZE,
+        factory: Callable[[], ToolCallAgent] = build_agent,
+    ):
+        self.size = max(1, size)
+        self._factory = factory
+        self._idle: asyncio.Queue = asyncio.Queue()
+    
+    async def fill(self) -> None:
+        """Build the agents (construction is blocking, so off the loop)."""
+        for _ in range(self.size - self._idle.qsize()):
+            self._idle.put_nowait(await asyncio.to_thread(self._factory))
+    
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ToolCallAgent]:
+        """Borrow an idle agent for one run."""
+        agent = await self._idle.get()
+        try:
+            yield agent
+        finally:
+            agent.current_step = 0
+            if hasattr(agent, 'memory') and hasattr(agent.memory, 'clear'):
+                agent.memory.clear()
+            self._idle.put_nowait(agent)
+
+
 class WalletGuardian:
     """
     High-level Wallet Guardian interface.
@@ -0,0 +1,115 @@
+"""
+In-process async result cache shared by the gateway servers.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+def _mark_retrieved(task: asyncio.Task) -> None:
+    # Every awaiting caller may have been cancelled; don't log the failure
+    # as never retrieved
+    if not task.cancelled():
+        task.exception()
+
+
+class AnalysisCache:
+    """
+    TTL + size bounded LRU for expensive async results (wallet analyses,
+    contract scans, upstream API metadata).
+    
+    Repeat queries for the same key skip the RPC fan-out and computation
+    entirely. Concurrent misses on the same key share one computation
+    instead of stampeding the upstream service.
+    """
+    
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value, _ = await self.fetch(key, compute)
+        return value
+    
+    async def fetch(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """
+        Like get_or_compute, but also report whether this call started the
+        computation (False for cache hits and for joining one in flight).
+        """
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value, False
+                del self._entries[key]
+            self.misses += 1
+            task = self._inflight.get(key)
+            computed = task is None
+            if computed:
+                # The computation runs in its own task and every caller
+                # (including the one that started it) awaits it shielded, so a
+                # cancelled caller doesn't cancel it for everyone else
+                task = asyncio.create_task(self._fill(key, compute))
+                task.add_done_callback(_mark_retrieved)
+                self._inflight[key] = task
+        
+        return await asyncio.shield(task), computed
+    
+    async def _fill(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Compute key's value and store it; failures aren't cached."""
+        # The bookkeeping below never awaits, so it can't interleave with a
+        # get_or_compute holding the lock
+        try:
+            value = await compute()
+        finally:
+            self._inflight.pop(key, None)
+        
+        # Keep a value put() while this was computing (e.g. a forced refresh):
+        # it is at least as fresh as this one
+        if key not in self._entries:
+            self.put(key, value)
+        return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value for key, replacing any cached entry."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def get(self, key: Hashable) -> Any:
+        """Return the fresh cached value for key, or None (misses aren't counted)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def discard(self, key: Hashable) -> None:
+        """Drop key so the next lookup recomputes it."""
+        self._entries.pop(key, None)
+    
+    def stats(self) -> dict:
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_entries": len(self._entries),
+            "cache_max_entries": self.max_entries,
+            "cache_ttl_seconds": self.ttl_seconds,
+        }
@@ -1,10 +1,17 @@
-"""Lightweight config loader for the agent."""
+"""Lightweight config loader for the agent.
+
+Getters are memoized: environment changes after the first call are not seen
+until ``_clear_config_cache()`` is called (e.g. in tests).
+"""
 
 import os
+from contextvars import ContextVar
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=1)
 def get_neo_rpc_url() -> str:
     return os.environ.get(
         "NEO_RPC_URL",
@@ -12,14 +19,17 @@ def get_neo_rpc_url() -> str:
     )
 
 
+@lru_cache(maxsize=1)
 def get_xerpa_api_key() -> str | None:
     return os.environ.get("XERPA_API_KEY")
 
 
+@lru_cache(maxsize=1)
 def get_aioz_api_key() -> str | None:
     return os.environ.get("AIOZ_API_KEY")
 
 
+@lru_cache(maxsize=1)
 def get_elevenlabs_api_key() -> str | None:
     """Get ElevenLabs API key for voice features."""
     return os.environ.get("ELEVENLABS_API_KEY")
@@ -46,6 +56,17 @@ class Config:
 
 _config: Optional[Config] = None
 
+# Per-request mock switch. Coroutine-local, so concurrent requests never see
+# each other's setting (unlike mutating os.environ).
+USE_MOCK: ContextVar[bool] = ContextVar("use_mock", default=False)
+
+
+def use_mock_enabled() -> bool:
+    """True if mock data was requested for this context or process-wide via env."""
+    if USE_MOCK.get():
+        return True
+    return os.environ.get("WALLET_GUARDIAN_USE_MOCK", "").lower() in ("1", "true", "yes", "on")
+
 
 def get_config() -> Config:
     """Get or create the global config instance."""
@@ -55,3 +76,11 @@ def get_config() -> Config:
     return _config
 
 
+def _clear_config_cache() -> None:
+    """Forget memoized env lookups so the next call re-reads the environment."""
+    global _config
+    get_neo_rpc_url.cache_clear()
+    get_xerpa_api_key.cache_clear()
+    get_aioz_api_key.cache_clear()
+    get_elevenlabs_api_key.cache_clear()
+    _config = None
@@ -18,6 +18,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+import orjson
+
 
 # =============================================================================
 # CACHING FOR CONTRACT DATA
@@ -31,6 +33,8 @@ _contract_source_cache: Dict[str, Tuple[Optional[Dict], float]] = {}
 _contract_info_cache: Dict[str, Tuple[Optional[Dict], float]] = {}
 _cache_lock = threading.Lock()
 
+_ETH_ADDRESS_RE = re.compile(r"^0x[a-fA-F0-9]{40}$")
+
 
 class Chain(Enum):
     """Supported blockchain networks."""
@@ -86,7 +90,7 @@ def detect_chain(address: str) -> Chain:
     
     # Ethereum/EVM addresses start with '0x' and are 42 characters
     if address.startswith("0x") and len(address) == 42:
-        if re.match(r"^0x[a-fA-F0-9]{40}$", address):
+        if _ETH_ADDRESS_RE.match(address):
             return Chain.ETHEREUM  # Default to mainnet, can be overridden
     
     return Chain.UNKNOWN
@@ -111,7 +115,7 @@ def is_valid_eth_address(address: str) -> Tuple[bool, str]:
     if len(address) != 42:
         return False, f"Invalid address length: {len(address)} (expected 42)"
     
-    if not re.match(r"^0x[a-fA-F0-9]{40}$", address):
+    if not _ETH_ADDRESS_RE.match(address):
         return False, "Address contains invalid characters"
     
     return True, ""
@@ -176,7 +180,7 @@ class EthClient:
         )
         
         with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+            data = orjson.loads(resp.read())
         
         if data.get("status") == "0" and data.get("message") != "No transactions found":
             error_msg = data.get("result", data.get("message", "Unknown error"))
@@ -196,7 +200,7 @@ class EthClient:
             "id": int(time.time()),
         }
         
-        data = json.dumps(payload).encode("utf-8")
+        data = orjson.dumps(payload)
         req = urllib.request.Request(
             self.rpc_url,
             data=data,
@@ -205,7 +209,7 @@ class EthClient:
         )
         
         with urllib.request.urlopen(req, timeout=15) as resp:
-            parsed = json.loads(resp.read().decode("utf-8"))
+            parsed = orjson.loads(resp.read())
         
         if "error" in parsed:
             raise RuntimeError(f"RPC error: {parsed['error']}")
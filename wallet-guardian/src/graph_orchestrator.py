@@ -112,7 +112,7 @@ class UnifiedDataFetcher:
                 return cached
             
             try:
-                balances = self.neo_client.get_nep17_balances(address)
+                balances = await self.neo_client.aget_nep17_balances(address)
                 self.cache.set("balances", balances, address=address)
                 return balances
             except NeoRPCError as e:
@@ -138,12 +138,42 @@ class UnifiedDataFetcher:
             start = now - lookback_days * 86400
             
             try:
-                transfers = self.neo_client.get_nep17_transfers(address, start, now)
+                transfers = await self.neo_client.aget_nep17_transfers(address, start, now)
                 self.cache.set("transfers", transfers, address=address, lookback=lookback_days)
                 return transfers
             except NeoRPCError as e:
                 raise e
     
+    async def get_many_transfers(
+        self,
+        addresses: List[str],
+        lookback_days: int = 30,
+        ttl: int = 60
+    ) -> Dict[str, Any]:
+        """Fetch transfers for many addresses, batching cache misses into one bounded RPC sweep."""
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        # dict.fromkeys drops repeated addresses (keeping order) so each is fetched once
+        for address in dict.fromkeys(addresses):
+            cached = self.cache.get("transfers", ttl=ttl, address=address, lookback=lookback_days)
+            if cached is not None:
+                results[address] = cached
+            else:
+                missing.append(address)
+        
+        if missing:
+            now = int(time.time())
+            start = now - lookback_days * 86400
+            fetched = await self.neo_client.aget_many_transfers(
+                [(address, start, now) for address in missing]
+            )
+            for address, transfers in zip(missing, fetched):
+                if not isinstance(transfers, Exception):
+                    self.cache.set("transfers", transfers, address=address, lookback=lookback_days)
+                results[address] = transfers
+        
+        return results
+    
     async def get_full_wallet_data(
         self, 
         address: str, 
@@ -698,7 +728,6 @@ class FetchWalletDataTool(BaseTool):
         return await self._fetcher.get_full_wallet_data(address, lookback_days)
     
     def call(self, address: str, lookback_days: int = 30):
-        import asyncio
         try:
             loop = asyncio.get_running_loop()
             return loop.run_until_complete(self.execute(address, lookback_days))
@@ -1,13 +1,59 @@
 """Minimal Neo N3 JSON-RPC client helpers."""
 
-import json
+import asyncio
+import itertools
 import re
-import time
 import urllib.request
 from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
+
 from .config import get_neo_rpc_url
 
+# Unique, monotonically increasing JSON-RPC request ids.
+_RPC_ID = itertools.count(1).__next__
+
+# Base58 alphabet (no 0, O, I, l); Neo N3 addresses are 'N' + 33 chars.
+_BASE58_CHARS = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_NEO_ADDR_RE = re.compile(r"N[1-9A-HJ-NP-Za-km-z]{33}")
+_ETH_ADDR_RE = re.compile(r"0x[a-fA-F0-9]{40}")
+
+# Upper bound on in-flight RPCs issued by the batched helpers.
+_BATCH_CONCURRENCY = 16
+
+# Process-wide keep-alive pools, one per RPC URL, shared by every NeoClient
+# (fetchers, tools and analyzers each construct their own client). Pools are
+# bound to the event loop that created them.
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+_shared_pools: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _shared_pool(rpc_url: str) -> httpx.AsyncClient:
+    """Get or create the pooled HTTP/2 client for an RPC URL on the running loop."""
+    loop = asyncio.get_running_loop()
+    entry = _shared_pools.get(rpc_url)
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+    client = httpx.AsyncClient(
+        base_url=rpc_url,
+        timeout=15.0,
+        limits=_POOL_LIMITS,
+        http2=True,
+        headers={"Content-Type": "application/json"},
+    )
+    _shared_pools[rpc_url] = (loop, client)
+    return client
+
+
+async def aclose_shared_pools() -> None:
+    """Close every shared RPC pool (call once at application shutdown)."""
+    pools = list(_shared_pools.values())
+    _shared_pools.clear()
+    for _, client in pools:
+        if not client.is_closed:
+            await client.aclose()
+
 
 class NeoRPCError(RuntimeError):
     """Raised when RPC returns an error."""
@@ -33,7 +79,7 @@ def detect_chain(address: str) -> str:
     
     # Ethereum addresses start with '0x' and are 42 characters (0x + 40 hex)
     if address.startswith("0x") and len(address) == 42:
-        if re.match(r"^0x[a-fA-F0-9]{40}$", address):
+        if _ETH_ADDR_RE.fullmatch(address):
             return "ethereum"
     
     # Neo Legacy addresses start with 'A'
@@ -68,11 +114,10 @@ def validate_neo_address_format(address: str) -> Tuple[bool, str]:
     if len(address) != 34:
         return False, f"Invalid Neo N3 address length: {len(address)} (expected 34)"
     
-    # Basic Base58 character check
-    base58_chars = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-    for char in address:
-        if char not in base58_chars:
-            return False, f"Invalid character '{char}' in address. Neo addresses use Base58 encoding"
+    # Basic Base58 character check (single C-level match; scan only to report the bad char)
+    if not _NEO_ADDR_RE.fullmatch(address):
+        char = next(c for c in address if c not in _BASE58_CHARS)
+        return False, f"Invalid character '{char}' in address. Neo addresses use Base58 encoding"
     
     return True, ""
 
@@ -81,14 +126,18 @@ class NeoClient:
     def __init__(self, rpc_url: Optional[str] = None):
         self.rpc_url = rpc_url or get_neo_rpc_url()
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP client used by the async methods (shared per RPC URL)."""
+        return _shared_pool(self.rpc_url)
+
+    async def aclose(self) -> None:
+        """Close the shared async connection pool for this client's RPC URL."""
+        entry = _shared_pools.pop(self.rpc_url, None)
+        if entry is not None and not entry[1].is_closed:
+            await entry[1].aclose()
+
     def _rpc(self, method: str, params: List[Any]) -> Any:
-        payload = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": int(time.time()),
-        }
-        data = json.dumps(payload).encode("utf-8")
+        data = orjson.dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": _RPC_ID()})
         req = urllib.request.Request(
             self.rpc_url,
             data=data,
@@ -96,7 +145,16 @@ class NeoClient:
             method="POST",
         )
         with urllib.request.urlopen(req, timeout=15) as resp:
-            parsed = json.loads(resp.read().decode("utf-8"))
+            parsed = orjson.loads(resp.read())
+        if "error" in parsed:
+            raise NeoRPCError(parsed["error"])
+        return parsed.get("result")
+
+    async def _rpc_async(self, method: str, params: List[Any]) -> Any:
+        data = orjson.dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": _RPC_ID()})
+        resp = await self._get_client().post("", content=data)
+        resp.raise_for_status()
+        parsed = orjson.loads(resp.content)
         if "error" in parsed:
             raise NeoRPCError(parsed["error"])
         return parsed.get("result")
@@ -143,6 +201,38 @@ class NeoClient:
         """Return transfers in/out for a time window."""
         return self._rpc("getnep17transfers", [address, start_time, end_time])
 
+    async def aget_nep17_balances(self, address: str) -> List[Dict[str, Any]]:
+        """Async variant of get_nep17_balances over the shared connection pool."""
+        result = await self._rpc_async("getnep17balances", [address])
+        return result.get("balance", [])
+
+    async def aget_nep17_transfers(self, address: str, start_time: int, end_time: int) -> Dict[str, Any]:
+        """Async variant of get_nep17_transfers over the shared connection pool."""
+        return await self._rpc_async("getnep17transfers", [address, start_time, end_time])
+
+    async def aget_many_transfers(
+        self,
+        pairs: List[Tuple[str, int, int]],
+        concurrency: int = _BATCH_CONCURRENCY,
+    ) -> List[Any]:
+        """
+        Fetch transfers for many (address, start_time, end_time) windows at once.
+        
+        Requests share the keep-alive pool and at most ``concurrency`` are in
+        flight. Results keep the input order; a failed window yields its
+        NeoRPCError/HTTP exception in place of the dict.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(address: str, start_time: int, end_time: int) -> Dict[str, Any]:
+            async with sem:
+                return await self.aget_nep17_transfers(address, start_time, end_time)
+
+        return await asyncio.gather(
+            *(fetch(address, start, end) for address, start, end in pairs),
+            return_exceptions=True,
+        )
+
     def get_contract_state(self, contract_hash: str) -> Optional[Dict[str, Any]]:
         """
         Get smart contract state/info by script hash.
@@ -165,6 +255,10 @@ class NeoClient:
         """Get current block height."""
         return self._rpc("getblockcount", [])
 
+    async def aget_block_count(self) -> int:
+        """Async variant of get_block_count over the shared connection pool."""
+        return await self._rpc_async("getblockcount", [])
+
     def get_block(self, index_or_hash: Any, verbose: int = 1) -> Optional[Dict[str, Any]]:
         """Get block by index or hash."""
         try:
@@ -203,6 +297,20 @@ class NeoClient:
         except NeoRPCError:
             return None
 
+    async def ainvoke_function(
+        self,
+        contract_hash: str,
+        method: str,
+        params: List[Any] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of invoke_function over the shared connection pool."""
+        try:
+            if not contract_hash.startswith("0x"):
+                contract_hash = "0x" + contract_hash
+            return await self._rpc_async("invokefunction", [contract_hash, method, params or []])
+        except NeoRPCError:
+            return None
+
     def get_storage(
         self,
         contract_hash: str,
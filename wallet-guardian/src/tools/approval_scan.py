@@ -55,7 +55,7 @@ class ApprovalScanTool(BaseTool):
 
     async def execute(self, address: str, lookback_days: int = 90) -> Dict[str, Any]:
         """Execute the approval scan."""
-        return self.call(address, lookback_days)
+        return await asyncio.to_thread(self.call, address, lookback_days)
 
     def call(self, address: str, lookback_days: int = 90) -> Dict[str, Any]:
         """
@@ -6,12 +6,12 @@ Supports auto-detection of chain based on address format.
 """
 
 import asyncio
-import os
 import time
 from typing import Any, ClassVar, Dict, List, Optional
 
 from spoon_ai.tools import BaseTool
 
+from ..config import use_mock_enabled
 from ..neo_client import NeoClient, NeoRPCError
 from ..eth_client import EthClient, Chain, detect_chain, is_valid_eth_address
 from ..graph_orchestrator import (
@@ -38,7 +38,8 @@ class GetWalletSummaryTool(BaseTool):
     }
 
     async def execute(self, address: str, chain: str = "auto", lookback_days: int = 30, use_mock: bool = False):
-        return self.call(address, chain, lookback_days, use_mock)
+        # RPC calls are blocking; keep them off the event loop
+        return await asyncio.to_thread(self.call, address, chain, lookback_days, use_mock)
 
     def call(self, address: str, chain: str = "auto", lookback_days: int = 30, use_mock: bool = False):
         # Auto-detect chain from address format
@@ -90,8 +91,7 @@ class GetWalletSummaryTool(BaseTool):
     def _get_neo_summary(self, address: str, lookback_days: int, use_mock: bool) -> Dict[str, Any]:
         """Get Neo N3 wallet summary (original implementation)."""
 
-        env_mock = os.environ.get("WALLET_GUARDIAN_USE_MOCK", "").lower() in ("1", "true", "yes", "on")
-        if use_mock or env_mock:
+        if use_mock or use_mock_enabled():
             return _mock_neo_summary(address=address, lookback_days=lookback_days)
 
         # Check cache first
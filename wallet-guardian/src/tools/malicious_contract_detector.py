@@ -266,7 +266,8 @@ class MaliciousContractDetectorTool(BaseTool):
         
         # Get the appropriate chain
         target_chain = self._get_chain(chain)
-        self._eth_client = EthClient(chain=target_chain)
+        # Local, not self._eth_client: one detector instance serves concurrent scans
+        eth_client = EthClient(chain=target_chain)
         chain_name = target_chain.value
         
         # Validate address
@@ -307,7 +308,7 @@ class MaliciousContractDetectorTool(BaseTool):
             return result
         
         # Check if it's actually a contract
-        if not self._eth_client.is_contract(contract_address):
+        if not eth_client.is_contract(contract_address):
             return {
                 "error": "Address is not a contract (EOA or empty)",
                 "contract_address": contract_address,
@@ -316,7 +317,7 @@ class MaliciousContractDetectorTool(BaseTool):
             }
         
         # Get contract source code
-        source_info = self._eth_client.get_contract_source_code(contract_address)
+        source_info = eth_client.get_contract_source_code(contract_address)
         
         if not source_info or not source_info.get("is_verified"):
             # Contract not verified - higher risk
@@ -435,7 +436,6 @@ class MaliciousContractDetectorTool(BaseTool):
                 response = llm(prompt)
             else:
                 # Fallback: try async run in sync context
-                import asyncio
                 response = asyncio.get_event_loop().run_until_complete(llm.agenerate(prompt))
             
             # Extract JSON from response
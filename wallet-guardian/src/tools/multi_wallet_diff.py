@@ -5,12 +5,17 @@ with shared caching across wallets.
 """
 
 import asyncio
+from collections import Counter
 from typing import ClassVar, List
 from spoon_ai.tools import BaseTool
 
 from ..advanced_features import PortfolioAnalyzer, PortfolioWallet
 
 
+# Shared across calls so every diff reuses one fetcher (and its RPC connection pool).
+_analyzer = PortfolioAnalyzer()
+
+
 class MultiWalletDiffTool(BaseTool):
     """Compare wallets for diversification and overlap using portfolio analysis."""
     
@@ -36,11 +41,18 @@ class MultiWalletDiffTool(BaseTool):
     }
 
     async def execute(self, addresses: List[str], lookback_days: int = 30):
-        analyzer = PortfolioAnalyzer()
         wallets = [PortfolioWallet(address=addr, label=f"Wallet {i+1}") 
                    for i, addr in enumerate(addresses)]
         
-        result = await analyzer.analyze_portfolio(wallets, lookback_days)
+        result = await _analyzer.analyze_portfolio(wallets, lookback_days)
+        
+        # Counterparties seen by more than one of the compared wallets
+        counterparty_counts = Counter(
+            cp
+            for analysis in result.individual_analyses.values()
+            for cp in set(analysis.get("counterparties", []))
+        )
+        shared_counterparties = {cp: n for cp, n in counterparty_counts.items() if n > 1}
         
         return {
             "addresses": addresses,
@@ -49,6 +61,7 @@ class MultiWalletDiffTool(BaseTool):
             "risk_level": result.risk_level,
             "diversification_score": result.diversification_score,
             "cross_wallet_activity": result.cross_wallet_activity,
+            "shared_counterparties": shared_counterparties,
             "highest_risk_wallet": result.highest_risk_wallet,
             "lowest_risk_wallet": result.lowest_risk_wallet,
             "individual_analyses": result.individual_analyses,
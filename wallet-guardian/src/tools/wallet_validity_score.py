@@ -4,6 +4,7 @@ Uses the canonical compute_risk_score from graph_orchestrator to ensure
 consistent scoring across the entire system.
 """
 
+import asyncio
 from typing import Any, ClassVar, Dict
 
 from spoon_ai.tools import BaseTool
@@ -34,12 +35,14 @@ class WalletValidityScoreTool(BaseTool):
         "required": ["address"],
     }
 
-    async def execute(self, address: str, lookback_days: int = 30) -> Dict[str, Any]:
-        return self.call(address, lookback_days)
+    async def execute(self, address: str, lookback_days: int = 30, use_mock: bool = False) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.call, address, lookback_days, use_mock)
 
-    def call(self, address: str, lookback_days: int = 30) -> Dict[str, Any]:
+    def call(self, address: str, lookback_days: int = 30, use_mock: bool = False) -> Dict[str, Any]:
         summary_tool = GetWalletSummaryTool()
-        summary = summary_tool.call(address=address, chain="neo3", lookback_days=lookback_days)
+        summary = summary_tool.call(
+            address=address, chain="neo3", lookback_days=lookback_days, use_mock=use_mock
+        )
         if isinstance(summary, dict) and summary.get("error"):
             return {"error": summary["error"]}
 
@@ -18,19 +18,32 @@ import asyncio
 import base64
 import hashlib
 import json
+import logging
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, AsyncIterator, Union
-import aiohttp
+from typing import Any, Callable, Dict, Iterator, List, Optional, AsyncIterator, Union
+
+import httpx
+
+try:
+    # SIMD (AVX2/AVX-512/NEON) base64 codecs; drop-in for the stdlib API
+    import pybase64 as _b64
+except ImportError:  # pragma: no cover - optional speedup
+    _b64 = base64
 
 from .config import get_config
 
 
 from .common import RiskLevel
 
+logger = logging.getLogger(__name__)
+if _b64 is not base64:
+    logger.debug("pybase64 SIMD path: %s", _b64.get_simd_path())
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -70,6 +83,12 @@ class VoiceConfig:
 # ELEVENLABS CLIENT
 # =============================================================================
 
+# Synthesized clips are billed per character and cost a full round trip,
+# while alert lines repeat constantly; keep recent clips in memory.
+TTS_CACHE_MAX_ENTRIES = int(os.getenv("TTS_CACHE_MAX_ENTRIES", "512"))
+TTS_CACHE_TTL_SECONDS = float(os.getenv("TTS_CACHE_TTL_SECONDS", "3600"))
+
+
 class ElevenLabsClient:
     """
     Async client for ElevenLabs Text-to-Speech API.
@@ -83,36 +102,85 @@ class ElevenLabsClient:
     
     BASE_URL = "https://api.elevenlabs.io/v1"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         self.api_key = api_key or os.environ.get("ELEVENLABS_API_KEY", "")
         if not self.api_key:
             config = get_config()
             self.api_key = getattr(config, 'elevenlabs_api_key', '')
         
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._audio_cache: Dict[str, bytes] = {}
-        self._cache_max_size = 100  # Max cached audio clips
-    
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={
-                    "xi-api-key": self.api_key,
-                    "Content-Type": "application/json",
-                }
+        self._headers = {
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json",
+        }
+        # A shared (app-owned) client keeps TLS sessions and keep-alive
+        # connections to ElevenLabs warm across requests; we only close our own
+        self._client = http_client
+        self._owns_client = http_client is None
+        # LRU of cache_key -> (expires_at, audio)
+        self._audio_cache: OrderedDict[bytes, tuple[float, bytes]] = OrderedDict()
+        self._cache_max_size = TTS_CACHE_MAX_ENTRIES
+        self._cache_ttl = TTS_CACHE_TTL_SECONDS
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the injected HTTP client, or lazily create our own."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300),
+                timeout=httpx.Timeout(30.0),
             )
-        return self._session
+            self._owns_client = True
+        return self._client
     
     async def close(self):
-        """Close the client session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-    
-    def _cache_key(self, text: str, voice_id: str, model_id: str) -> str:
-        """Generate cache key for audio."""
-        content = f"{text}:{voice_id}:{model_id}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client and self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+    
+    def _cache_key(self, text: str, config: VoiceConfig, output_format: str) -> bytes:
+        """Generate cache key for audio (text, voice, model and voice settings)."""
+        content = (
+            f"{text}\0{config.voice_id}\0{config.model_id}\0{config.stability}\0"
+            f"{config.similarity_boost}\0{config.style}\0{config.use_speaker_boost}\0{output_format}"
+        )
+        return hashlib.blake2b(content.encode(), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[bytes]:
+        """Return cached audio for key if present and fresh."""
+        entry = self._audio_cache.get(key)
+        if entry is not None:
+            expires_at, audio = entry
+            if expires_at > time.monotonic():
+                self._audio_cache.move_to_end(key)
+                self.cache_hits += 1
+                return audio
+            del self._audio_cache[key]
+        self.cache_misses += 1
+        return None
+    
+    def _cache_put(self, key: bytes, audio: bytes):
+        """Store audio, evicting the least recently used clips."""
+        self._audio_cache[key] = (time.monotonic() + self._cache_ttl, audio)
+        self._audio_cache.move_to_end(key)
+        while len(self._audio_cache) > self._cache_max_size:
+            self._audio_cache.popitem(last=False)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Audio cache counters for observability."""
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_entries": len(self._audio_cache),
+            "cache_max_entries": self._cache_max_size,
+            "cache_bytes": sum(len(audio) for _, audio in self._audio_cache.values()),
+            "cache_ttl_seconds": self._cache_ttl,
+        }
     
     async def synthesize(
         self,
@@ -134,11 +202,12 @@ class ElevenLabsClient:
         config = voice_config or VoiceConfig()
         
         # Check cache
-        cache_key = self._cache_key(text, config.voice_id, config.model_id)
-        if cache_key in self._audio_cache:
-            return self._audio_cache[cache_key]
+        cache_key = self._cache_key(text, config, output_format)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
-        session = await self._get_session()
+        client = self._get_client()
         url = f"{self.BASE_URL}/text-to-speech/{config.voice_id}"
         
         payload = {
@@ -154,19 +223,14 @@ class ElevenLabsClient:
         
         params = {"output_format": output_format}
         
-        async with session.post(url, json=payload, params=params) as resp:
-            if resp.status != 200:
-                error = await resp.text()
-                raise ElevenLabsError(f"Synthesis failed: {resp.status} - {error}")
-            
-            audio_data = await resp.read()
+        resp = await client.post(url, json=payload, params=params, headers=self._headers)
+        if resp.status_code != 200:
+            raise ElevenLabsError(f"Synthesis failed: {resp.status_code} - {resp.text}")
+        
+        audio_data = resp.content
         
         # Cache the result
-        if len(self._audio_cache) >= self._cache_max_size:
-            # Remove oldest entry
-            oldest_key = next(iter(self._audio_cache))
-            del self._audio_cache[oldest_key]
-        self._audio_cache[cache_key] = audio_data
+        self._cache_put(cache_key, audio_data)
         
         return audio_data
     
@@ -174,6 +238,8 @@ class ElevenLabsClient:
         self,
         text: str,
         voice_config: Optional[VoiceConfig] = None,
+        output_format: str = "mp3_44100_128",
+        optimize_streaming_latency: int = 3,
     ) -> AsyncIterator[bytes]:
         """
         Stream synthesized audio in chunks for real-time playback.
@@ -181,7 +247,7 @@ class ElevenLabsClient:
         Yields audio chunks as they're generated.
         """
         config = voice_config or VoiceConfig()
-        session = await self._get_session()
+        client = self._get_client()
         
         url = f"{self.BASE_URL}/text-to-speech/{config.voice_id}/stream"
         
@@ -196,32 +262,34 @@ class ElevenLabsClient:
             }
         }
         
-        async with session.post(url, json=payload) as resp:
-            if resp.status != 200:
-                error = await resp.text()
-                raise ElevenLabsError(f"Stream synthesis failed: {resp.status} - {error}")
+        params = {
+            "output_format": output_format,
+            "optimize_streaming_latency": optimize_streaming_latency,
+        }
+        
+        async with client.stream(
+            "POST", url, json=payload, params=params, headers=self._headers
+        ) as resp:
+            if resp.status_code != 200:
+                error = (await resp.aread()).decode(errors="replace")
+                raise ElevenLabsError(f"Stream synthesis failed: {resp.status_code} - {error}")
             
-            async for chunk in resp.content.iter_chunked(1024):
+            async for chunk in resp.aiter_bytes(1024):
                 yield chunk
     
     async def get_voices(self) -> List[Dict[str, Any]]:
         """Get available voices."""
-        session = await self._get_session()
-        
-        async with session.get(f"{self.BASE_URL}/voices") as resp:
-            if resp.status != 200:
-                raise ElevenLabsError(f"Failed to get voices: {resp.status}")
-            data = await resp.json()
-            return data.get("voices", [])
+        resp = await self._get_client().get(f"{self.BASE_URL}/voices", headers=self._headers)
+        if resp.status_code != 200:
+            raise ElevenLabsError(f"Failed to get voices: {resp.status_code}")
+        return resp.json().get("voices", [])
     
     async def get_user_info(self) -> Dict[str, Any]:
         """Get user subscription info including character usage."""
-        session = await self._get_session()
-        
-        async with session.get(f"{self.BASE_URL}/user") as resp:
-            if resp.status != 200:
-                raise ElevenLabsError(f"Failed to get user info: {resp.status}")
-            return await resp.json()
+        resp = await self._get_client().get(f"{self.BASE_URL}/user", headers=self._headers)
+        if resp.status_code != 200:
+            raise ElevenLabsError(f"Failed to get user info: {resp.status_code}")
+        return resp.json()
 
 
 class ElevenLabsError(Exception):
@@ -249,8 +317,9 @@ class VoiceGuardian:
         self,
         api_key: Optional[str] = None,
         default_persona: VoicePersona = VoicePersona.PROFESSIONAL,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
-        self.client = ElevenLabsClient(api_key)
+        self.client = ElevenLabsClient(api_key, http_client=http_client)
         self.default_persona = default_persona
         self.voice_config = VoiceConfig()
         self._listeners: List[Callable[[bytes, str], None]] = []
@@ -306,6 +375,18 @@ class VoiceGuardian:
         Returns:
             Audio bytes (MP3)
         """
+        message, config = self._prepare_alert(message, severity, address)
+        audio = await self.client.synthesize(message, config)
+        self._emit_audio(audio, f"alert_{severity.value}")
+        return audio
+    
+    def _prepare_alert(
+        self,
+        message: str,
+        severity: AlertSeverity,
+        address: Optional[str],
+    ) -> tuple[str, VoiceConfig]:
+        """Build the spoken alert text and voice settings for a severity."""
         # Prepare message with privacy
         if address:
             short_addr = f"{address[:6]}...{address[-4:]}"
@@ -326,9 +407,7 @@ class VoiceGuardian:
             config.stability = 0.3  # More dramatic
             config.style = 0.2     # More expressive
         
-        audio = await self.client.synthesize(message, config)
-        self._emit_audio(audio, f"alert_{severity.value}")
-        return audio
+        return message, config
     
     async def speak_suspicious_activity(
         self,
@@ -509,14 +588,15 @@ class VoiceGuardian:
         self,
         message: str,
         severity: AlertSeverity = AlertSeverity.LOW,
+        address: Optional[str] = None,
     ) -> AsyncIterator[bytes]:
         """
         Stream an alert for real-time playback.
         
-        Yields audio chunks as they're generated.
+        Same wording and voice as speak_alert, but yields MP3 chunks as
+        ElevenLabs produces them instead of buffering the whole clip.
         """
-        persona = self._get_voice_for_severity(severity)
-        config = VoiceConfig(voice_id=self._get_voice_for_persona(persona))
+        message, config = self._prepare_alert(message, severity, address)
         
         async for chunk in self.client.synthesize_stream(message, config):
             yield chunk
@@ -619,6 +699,131 @@ class VoiceAlertSystem:
                 print(f"Voice alert error: {e}")
 
 
+# =============================================================================
+# REQUEST POOL
+# =============================================================================
+
+VOICE_POOL_MAX_BATCH = int(os.getenv("VOICE_POOL_MAX_BATCH", "8"))
+VOICE_POOL_CONCURRENCY = int(os.getenv("VOICE_POOL_CONCURRENCY", "8"))
+
+
+class VoicePool:
+    """
+    Request pool for concurrent TTS calls.
+
+    Callers submit a line and get a future back. A single worker drains up
+    to ``max_batch`` queued lines per iteration and fires them concurrently
+    without waiting for the previous batch, so a burst of callers costs
+    about one ElevenLabs round trip instead of queueing behind each other.
+    Identical lines in a batch share one request, and a semaphore keeps
+    in-flight calls within the account's concurrency allowance.
+    """
+
+    def __init__(
+        self,
+        voice: VoiceGuardian,
+        max_batch: int = VOICE_POOL_MAX_BATCH,
+        concurrency: int = VOICE_POOL_CONCURRENCY,
+    ):
+        self.voice = voice
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def start(self):
+        """Start the pool worker."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the worker, let in-flight batches finish and cancel the rest."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            future.cancel()
+
+    def submit(
+        self,
+        text: str,
+        config: VoiceConfig,
+        message_type: str,
+    ) -> asyncio.Future:
+        """Queue a line for synthesis; the future resolves to MP3 bytes."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, config, message_type, future))
+        return future
+
+    def submit_alert(
+        self,
+        message: str,
+        severity: AlertSeverity = AlertSeverity.LOW,
+        address: Optional[str] = None,
+    ) -> asyncio.Future:
+        """Pooled equivalent of VoiceGuardian.speak_alert()."""
+        text, config = self.voice._prepare_alert(message, severity, address)
+        return self.submit(text, config, f"alert_{severity.value}")
+
+    def submit_query(
+        self,
+        response: str,
+        persona: Optional[VoicePersona] = None,
+    ) -> asyncio.Future:
+        """Pooled equivalent of VoiceGuardian.speak_query_response()."""
+        config = VoiceConfig(
+            voice_id=self.voice._get_voice_for_persona(persona or self.voice.default_persona)
+        )
+        return self.submit(response, config, "query_response")
+
+    async def _run(self):
+        """Drain the queue into batches and dispatch each in the background."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[tuple]):
+        """Synthesize one batch, coalescing identical lines."""
+        groups: Dict[tuple, List[tuple]] = {}
+        for item in batch:
+            text, config = item[0], item[1]
+            key = (
+                text, config.voice_id, config.model_id, config.stability,
+                config.similarity_boost, config.style, config.use_speaker_boost,
+            )
+            groups.setdefault(key, []).append(item)
+
+        await asyncio.gather(*(self._synthesize(items) for items in groups.values()))
+
+    async def _synthesize(self, items: List[tuple]):
+        """Run one synthesis call and resolve every caller waiting on it."""
+        text, config = items[0][0], items[0][1]
+        try:
+            async with self._semaphore:
+                audio = await self.voice.client.synthesize(text, config)
+        except Exception as e:
+            for *_, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, _, message_type, future in items:
+            self.voice._emit_audio(audio, message_type)
+            # The caller may have gone away (client disconnect)
+            if not future.done():
+                future.set_result(audio)
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -667,7 +872,27 @@ async def speak_wallet_summary(summary: Dict[str, Any]) -> bytes:
 
 def audio_to_base64(audio_bytes: bytes) -> str:
     """Convert audio bytes to base64 for WebSocket transmission."""
-    return base64.b64encode(audio_bytes).decode('utf-8')
+    return _b64.b64encode(audio_bytes).decode('ascii')
+
+
+# 48 KiB of input per chunk: a multiple of 3, so chunks concatenate into one
+# valid base64 string with no inner padding
+BASE64_CHUNK_BYTES = 49152
+
+
+def audio_to_base64_chunks(
+    audio_bytes: bytes,
+    chunk_size: int = BASE64_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """
+    Yield the base64 encoding of audio_bytes in bounded pieces.
+    
+    Concatenated, the pieces equal audio_to_base64(audio_bytes); peak extra
+    memory is one encoded chunk rather than the whole base64 string.
+    """
+    view = memoryview(audio_bytes)
+    for i in range(0, len(view), chunk_size):
+        yield _b64.b64encode(view[i:i + chunk_size])
 
 
 def create_audio_message(
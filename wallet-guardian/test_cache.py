@@ -0,0 +1,132 @@
+"""Tests for the shared AnalysisCache."""
+
+import asyncio
+
+from src.cache import AnalysisCache
+
+
+def test_concurrent_misses_share_one_computation():
+    """Two callers on the same cold key run compute once."""
+    async def run():
+        cache = AnalysisCache()
+        calls = 0
+        
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+        
+        results = await asyncio.gather(
+            cache.get_or_compute("k", compute),
+            cache.get_or_compute("k", compute),
+        )
+        return results, calls
+    
+    results, calls = asyncio.run(run())
+    assert results == ["value", "value"]
+    assert calls == 1
+
+
+def test_cancelled_owner_does_not_fail_waiters():
+    """Cancelling the caller that started a computation leaves the others unaffected."""
+    async def run():
+        cache = AnalysisCache()
+        release = asyncio.Event()
+        
+        async def compute():
+            await release.wait()
+            return "value"
+        
+        owner = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        
+        value = await waiter
+        return owner.cancelled(), value, cache.get("k")
+    
+    owner_cancelled, value, cached = asyncio.run(run())
+    assert owner_cancelled
+    assert value == "value"
+    assert cached == "value"
+
+
+def test_fetch_reports_only_the_caller_that_computed():
+    """Joining an in-flight computation or hitting the cache isn't a compute."""
+    async def run():
+        cache = AnalysisCache()
+        
+        async def compute():
+            await asyncio.sleep(0.01)
+            return "value"
+        
+        first, joined = await asyncio.gather(
+            cache.fetch("k", compute),
+            cache.fetch("k", compute),
+        )
+        return first, joined, await cache.fetch("k", compute)
+    
+    first, joined, cached = asyncio.run(run())
+    assert first == ("value", True)
+    assert joined == ("value", False)
+    assert cached == ("value", False)
+
+
+def test_put_during_computation_is_kept():
+    """A value stored while a computation runs isn't overwritten by its older result."""
+    async def run():
+        cache = AnalysisCache()
+        release = asyncio.Event()
+        
+        async def compute():
+            await release.wait()
+            return "stale"
+        
+        pending = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        cache.put("k", "fresh")
+        release.set()
+        return await pending, cache.get("k")
+    
+    computed, cached = asyncio.run(run())
+    assert computed == "stale"
+    assert cached == "fresh"
+
+
+def test_failures_are_not_cached():
+    """A failed computation is shared by waiters but recomputed afterwards."""
+    async def run():
+        cache = AnalysisCache()
+        
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+        
+        outcomes = await asyncio.gather(
+            cache.get_or_compute("k", fail),
+            cache.get_or_compute("k", fail),
+            return_exceptions=True,
+        )
+        
+        async def succeed():
+            return "value"
+        
+        return outcomes, await cache.get_or_compute("k", succeed)
+    
+    outcomes, value = asyncio.run(run())
+    assert all(isinstance(o, ValueError) for o in outcomes)
+    assert value == "value"
+
+
+if __name__ == "__main__":
+    test_concurrent_misses_share_one_computation()
+    test_cancelled_owner_does_not_fail_waiters()
+    test_fetch_reports_only_the_caller_that_computed()
+    test_put_during_computation_is_kept()
+    test_failures_are_not_cached()
+    print("AnalysisCache tests passed")